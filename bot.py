@@ -7,11 +7,12 @@ import logging
 import json
 import os
 import asyncio
+import aiohttp
 import discord
 from discord.ext import commands, tasks
 from discord import app_commands
 from typing import Dict, List, Set
-from discord.utils import utcnow, format_dt
+from discord.utils import utcnow
 
 # === OPTIONAL: Legacy global role IDs fallback ===
 ALLOWED_ROLE_IDS = {
@@ -83,6 +84,7 @@ class DiscordBot(commands.Bot):
         # health/uptime tracking
         self.boot_time = utcnow()
         self.last_sync_time = None
+        self._keep_alive_counter = 0
 
         # optional flag some cogs check
         self._did_tree_sync = False
@@ -102,17 +104,14 @@ class DiscordBot(commands.Bot):
                 pass
             
             # Optional: Send a heartbeat message to console every hour
-            if hasattr(self, '_keep_alive_counter'):
-                self._keep_alive_counter += 1
-                if self._keep_alive_counter >= 12:  # 12 * 5 minutes = 1 hour
-                    try:
-                        uptime_str = self._get_uptime_string()
-                        self.logger.info(f"Bot keep-alive heartbeat - Uptime: {uptime_str}")
-                    except (OSError, ValueError):
-                        # Ignore logging errors - they don't affect bot functionality
-                        pass
-                    self._keep_alive_counter = 0
-            else:
+            self._keep_alive_counter += 1
+            if self._keep_alive_counter >= 12:  # 12 * 5 minutes = 1 hour
+                try:
+                    uptime_str = self._get_uptime_string()
+                    self.logger.info(f"Bot keep-alive heartbeat - Uptime: {uptime_str}")
+                except (OSError, ValueError):
+                    # Ignore logging errors - they don't affect bot functionality
+                    pass
                 self._keep_alive_counter = 0
                 
         except Exception as e:
@@ -142,6 +141,20 @@ class DiscordBot(commands.Bot):
         else:
             return f"{minutes}m"
 
+    async def login(self, token: str):
+        """Give the REST session longer-lived keep-alive connections before discord.py opens it."""
+        # Bursts of mod actions then reuse warm TCP/TLS connections instead of
+        # handshaking again; the connector must be built inside the running loop.
+        # limit=0 keeps discord.py's unbounded pool; concurrency is capped by RouteGate.
+        if self.http.connector is discord.utils.MISSING:
+            self.http.connector = aiohttp.TCPConnector(
+                limit=0,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+        await super().login(token)
+
     async def setup_hook(self):
         """Load extensions and sync commands when the bot starts."""
         # Load all cogs
@@ -324,7 +337,7 @@ class DiscordBot(commands.Bot):
     def get_guild_mod_role_ids(self, guild_id: int) -> Set[int]:
         roles = self.mod_whitelist.get(str(guild_id))
         if roles:
-            return set(int(r) for r in roles)
+            return set(map(int, roles))
         return set(ALLOWED_ROLE_IDS)
 
     def add_guild_mod_role(self, guild_id: int, role_id: int) -> None:
@@ -360,7 +373,7 @@ class DiscordBot(commands.Bot):
     def get_guild_mod_user_ids(self, guild_id: int) -> Set[int]:
         users = self.mod_whitelist_users.get(str(guild_id))
         if users:
-            return set(int(u) for u in users)
+            return set(map(int, users))
         return set()
 
     def add_guild_mod_user(self, guild_id: int, user_id: int) -> None:
@@ -447,8 +460,8 @@ class DiscordBot(commands.Bot):
             roles_map: Dict[int, Set[int]] = {}
             for gid_str, payload in data.items():
                 gid = int(gid_str)
-                users = set(int(u) for u in payload.get("users", []))
-                roles = set(int(r) for r in payload.get("roles", []))
+                users = set(map(int, payload.get("users", [])))
+                roles = set(map(int, payload.get("roles", [])))
                 users_map[gid] = users
                 roles_map[gid] = roles
 
@@ -517,9 +530,10 @@ class DiscordBot(commands.Bot):
     def allow_alt(self, member: discord.Member) -> bool:
         if not isinstance(member, discord.Member):
             return False
+        perms = member.guild_permissions
         return (
-            member.guild_permissions.administrator
-            or member.guild_permissions.manage_guild
+            perms.administrator
+            or perms.manage_guild
             or self.is_alt_whitelisted(member)
         )
 
@@ -579,7 +593,9 @@ class DiscordBot(commands.Bot):
         self.logger.error(f"Command error in {getattr(ctx, 'command', None)}: {error}")
 
         try:
-            if isinstance(error, commands.NoPrivateMessage):
+            if isinstance(error, commands.CommandOnCooldown):
+                msg = f"⏳ Slow down, retry in {error.retry_after:.1f}s."
+            elif isinstance(error, commands.NoPrivateMessage):
                 msg = "❌ This command can only be used in a server."
             elif isinstance(error, commands.CheckFailure):
                 msg = "❌ You don't have permission to use this command."
@@ -626,43 +642,3 @@ class DiscordBot(commands.Bot):
         # Call the parent close method
         await super().close()
         self.logger.info("Bot shutdown completed")
-
-    # ---------- /health (public) ----------
-    @app_commands.command(name="health", description="Show bot health / status.")
-    async def health(self, interaction: discord.Interaction):
-        latency_ms = round(self.latency * 1000)
-        guild_count = len(self.guilds)
-        shard_info = (
-            f"{self.shard_id + 1}/{self.shard_count}"
-            if self.shard_id is not None and self.shard_count
-            else "—"
-        )
-
-        delta = utcnow() - self.boot_time
-        days = delta.days
-        hours, rem = divmod(delta.seconds, 3600)
-        minutes, seconds = divmod(rem, 60)
-        parts = []
-        if days: parts.append(f"{days}d")
-        if hours: parts.append(f"{hours}h")
-        if minutes: parts.append(f"{minutes}m")
-        parts.append(f"{seconds}s")
-        uptime_str = " ".join(parts)
-
-        embed = discord.Embed(
-            title="✅ Bot Health",
-            color=discord.Color.green(),
-            description="The bot is running and connected to Discord."
-        )
-        if self.user:
-            embed.set_author(name=str(self.user), icon_url=self.user.display_avatar.url)
-
-        embed.add_field(name="Latency", value=f"{latency_ms} ms", inline=True)
-        embed.add_field(name="Guilds", value=str(guild_count), inline=True)
-        embed.add_field(name="Shard", value=shard_info, inline=True)
-        embed.add_field(name="Uptime", value=uptime_str, inline=True)
-        embed.add_field(name="Started", value=format_dt(self.boot_time, style='F'), inline=True)
-        if self.last_sync_time:
-            embed.add_field(name="Last Slash Sync", value=format_dt(self.last_sync_time, style='R'), inline=True)
-
-        await interaction.response.send_message(embed=embed, ephemeral=True)
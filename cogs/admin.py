@@ -9,15 +9,18 @@ import json
 import asyncio
 import io
 import httpx
+from collections import defaultdict
 from datetime import datetime
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
 from utils.permissions import mod_check
 from typing import Optional, Set, Union
 import typing
 import logging
 
+logger = logging.getLogger(__name__)
+
 # Import the alt generation function
 try:
     from roblox_alts import get_alt_public
@@ -25,6 +28,20 @@ except ImportError:
     async def get_alt_public():
         return None
 
+# Pre-OR'd permission masks, tested against Permissions.value in one AND
+MANAGE_GUILD_OR_ADMIN = discord.Permissions(manage_guild=True, administrator=True).value
+MANAGE_ROLES_OR_ADMIN = discord.Permissions(manage_roles=True, administrator=True).value
+MANAGE_NICKNAMES_OR_ADMIN = discord.Permissions(manage_nicknames=True, administrator=True).value
+
+# Green for success embeds, built once instead of per embed
+EMBED_COLOR = discord.Color.green()
+
+# Permission names as the Discord client shows them, where .title() gets them wrong
+_PERM_LABELS = {
+    "manage_guild": "Manage Server",
+    "moderate_members": "Timeout Members",
+}
+
 
 class CookieView(discord.ui.View):
     """View with button to show cookie."""
@@ -57,10 +74,22 @@ class CookieView(discord.ui.View):
 class AdminCog(commands.Cog):
     """Administrative commands and bot management."""
 
+    # Embed templates for addmod/removemod; copied per use via _from_template
+    _MOD_ADDED_TEMPLATE = discord.Embed(color=EMBED_COLOR).add_field(
+        name="📋 Permissions Granted",
+        value="• All moderation commands\n• All utility commands\n• Admin commands (if admin)\n• ❌ Alt generation (excluded)",
+        inline=False
+    )
+    _MOD_REMOVED_TEMPLATE = discord.Embed(color=discord.Color.red()).add_field(
+        name="📋 Permissions Revoked",
+        value="• All moderation commands\n• All utility commands\n• Admin commands (unless admin)",
+        inline=False
+    )
+
     def __init__(self, bot):
         self.bot = bot
-        self.logger = logging.getLogger(__name__)
         self.no_pings = discord.AllowedMentions.none()
+        self.default_allowed = discord.AllowedMentions(everyone=False, users=True, roles=True)
         
         # Bot status persistence file
         self.status_file = "data/bot_status.json"
@@ -71,6 +100,21 @@ class AdminCog(commands.Cog):
         # Load saved status/presence settings
         self.saved_status = self.load_status_settings()
         
+        # In-memory alt role backup, kept on the bot so it survives cog reloads
+        store = getattr(bot, "_alt_role_whitelist", None)
+        if not isinstance(store, defaultdict):
+            store = defaultdict(set, store or {})
+            bot._alt_role_whitelist = store
+        self._alt_role_store: "defaultdict[int, Set[int]]" = store
+
+        # Persistent alt role storage hooks on the bot, resolved once (None if absent)
+        self._persist_get_alt_roles = getattr(bot, "get_alt_roles", None)
+        self._persist_add_alt_role = getattr(bot, "add_alt_role", None)
+        self._persist_remove_alt_role = getattr(bot, "remove_alt_role", None)
+
+        # Prefix command messages waiting to be bulk-deleted, keyed by channel id
+        self._pending_deletes: "defaultdict[int, list[discord.Message]]" = defaultdict(list)
+
         # Allowed roles for /say command
         self.allowed_say_roles = {
             1383421890403762286,
@@ -81,6 +125,33 @@ class AdminCog(commands.Cog):
         # Initialize status on bot ready
         self.bot.loop.create_task(self.restore_status_on_ready())
 
+    async def cog_load(self):
+        self.flush_pending_deletes.start()
+
+    async def cog_unload(self):
+        self.flush_pending_deletes.cancel()
+        await self.flush_pending_deletes()
+
+    async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        """Report failed slash command permission checks to the user; log anything else."""
+        if isinstance(error, app_commands.MissingPermissions):
+            perms = ", ".join(_PERM_LABELS.get(p) or p.replace("_", " ").title() for p in error.missing_permissions)
+            msg = f"❌ You need **{perms}** permission."
+        elif isinstance(error, app_commands.NoPrivateMessage):
+            msg = "❌ This command can only be used in a server."
+        else:
+            # Having this handler stops the tree from logging the error itself
+            command = interaction.command.qualified_name if interaction.command else None
+            logger.error("Slash command %s failed", command, exc_info=error)
+            msg = "❌ Something went wrong while running this command."
+        try:
+            if interaction.response.is_done():
+                await interaction.followup.send(msg, ephemeral=True)
+            else:
+                await interaction.response.send_message(msg, ephemeral=True)
+        except discord.HTTPException:
+            pass
+
     def load_status_settings(self):
         """Load saved status and presence settings from file."""
         try:
@@ -88,7 +159,7 @@ class AdminCog(commands.Cog):
                 with open(self.status_file, 'r') as f:
                     return json.load(f)
         except Exception as e:
-            self.logger.error(f"Failed to load status settings: {e}")
+            logger.error(f"Failed to load status settings: {e}")
         
         # Default settings
         return {
@@ -111,9 +182,9 @@ class AdminCog(commands.Cog):
             with open(self.status_file, 'w') as f:
                 json.dump(self.saved_status, f, indent=2)
             
-            self.logger.info("Status settings saved to file")
+            logger.info("Status settings saved to file")
         except Exception as e:
-            self.logger.error(f"Failed to save status settings: {e}")
+            logger.error(f"Failed to save status settings: {e}")
     
     async def restore_status_on_ready(self):
         """Restore saved status and presence when bot becomes ready."""
@@ -158,33 +229,22 @@ class AdminCog(commands.Cog):
                 activity=activity
             )
             
-            self.logger.info(f"Restored bot status: {activity_type} {activity_name} | {presence}")
+            logger.info(f"Restored bot status: {activity_type} {activity_name} | {presence}")
             
         except Exception as e:
-            self.logger.error(f"Failed to restore bot status: {e}")
+            logger.error(f"Failed to restore bot status: {e}")
             # Fallback to default
             try:
                 activity = discord.Activity(type=discord.ActivityType.watching, name="for rule violations")
                 await self.bot.change_presence(status=discord.Status.dnd, activity=activity)
             except Exception as fallback_error:
-                self.logger.error(f"Fallback status setting also failed: {fallback_error}")
-            
-            # Set status and presence
-            await self.bot.change_presence(
-                status=presence_mapping.get(presence, discord.Status.online),
-                activity=activity
-            )
-            
-            self.logger.info(f"Restored bot status: {activity_type} {activity_name} | {presence}")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to restore bot status: {e}")
+                logger.error(f"Fallback status setting also failed: {fallback_error}")
 
     @commands.Cog.listener()
     async def on_ready(self):
         """Called when the cog is ready."""
         guild_count = len(self.bot.guilds)
-        self.logger.info(f"AdminCog ready in {guild_count} guilds")
+        logger.info(f"AdminCog ready in {guild_count} guilds")
 
     # =========================================================
     # UTILITY COMMANDS
@@ -214,6 +274,50 @@ class AdminCog(commands.Cog):
         except Exception as e:
             await ctx.send(f"❌ Failed to reload `{cog}`: {str(e)}", ephemeral=True)
 
+    @app_commands.command(name="health", description="Show bot health / status.")
+    async def health(self, interaction: discord.Interaction):
+        """Show latency, uptime and sync information."""
+        latency_ms = round(self.bot.latency * 1000)
+        guild_count = len(self.bot.guilds)
+        shard_info = (
+            f"{self.bot.shard_id + 1}/{self.bot.shard_count}"
+            if self.bot.shard_id is not None and self.bot.shard_count
+            else "—"
+        )
+
+        delta = discord.utils.utcnow() - self.bot.boot_time
+        days = delta.days
+        hours, rem = divmod(delta.seconds, 3600)
+        minutes, seconds = divmod(rem, 60)
+        parts = []
+        if days: parts.append(f"{days}d")
+        if hours: parts.append(f"{hours}h")
+        if minutes: parts.append(f"{minutes}m")
+        parts.append(f"{seconds}s")
+        uptime_str = " ".join(parts)
+
+        embed = discord.Embed(
+            title="✅ Bot Health",
+            color=EMBED_COLOR,
+            description="The bot is running and connected to Discord."
+        )
+        if self.bot.user:
+            embed.set_author(name=str(self.bot.user), icon_url=self.bot.user.display_avatar.url)
+
+        fields = [
+            ("Latency", f"{latency_ms} ms"),
+            ("Guilds", str(guild_count)),
+            ("Shard", shard_info),
+            ("Uptime", uptime_str),
+            ("Started", discord.utils.format_dt(self.bot.boot_time, style='F')),
+        ]
+        if self.bot.last_sync_time:
+            fields.append(("Last Slash Sync", discord.utils.format_dt(self.bot.last_sync_time, style='R')))
+        for name, value in fields:
+            embed.add_field(name=name, value=value, inline=True)
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     # =========================================================
     # ALT GENERATION COMMANDS
     # =========================================================
@@ -273,7 +377,7 @@ class AdminCog(commands.Cog):
                 # Try to get user ID from Roblox API using username
                 try:
                     import aiohttp
-                    self.logger.info(f"Fetching user ID for username: {username}")
+                    logger.info(f"Fetching user ID for username: {username}")
                     async with aiohttp.ClientSession() as session:
                         # Get user ID from username
                         async with session.post("https://users.roblox.com/v1/usernames/users", 
@@ -282,7 +386,7 @@ class AdminCog(commands.Cog):
                                 data = await resp.json()
                                 if data.get("data") and len(data["data"]) > 0:
                                     user_id = data["data"][0].get("id")
-                                    self.logger.info(f"Found user ID: {user_id}")
+                                    logger.info(f"Found user ID: {user_id}")
                                     
                                     # Now get avatar using user ID
                                     if user_id:
@@ -291,13 +395,13 @@ class AdminCog(commands.Cog):
                                                 avatar_data = await avatar_resp.json()
                                                 if avatar_data.get("data") and len(avatar_data["data"]) > 0:
                                                     avatar_url = avatar_data["data"][0].get("imageUrl")
-                                                    self.logger.info(f"Found avatar URL: {avatar_url}")
+                                                    logger.info(f"Found avatar URL: {avatar_url}")
                                             else:
-                                                self.logger.warning(f"Avatar API returned status {avatar_resp.status}")
+                                                logger.warning(f"Avatar API returned status {avatar_resp.status}")
                             else:
-                                self.logger.warning(f"Username API returned status {resp.status}")
+                                logger.warning(f"Username API returned status {resp.status}")
                 except Exception as e:
-                    self.logger.warning(f"Failed to fetch Roblox user info: {e}")
+                    logger.warning(f"Failed to fetch Roblox user info: {e}")
             
             # Add User ID field if we found it
             if user_id:
@@ -306,19 +410,19 @@ class AdminCog(commands.Cog):
             # Set avatar image if we got one
             if avatar_url:
                 embed.set_thumbnail(url=avatar_url)
-                self.logger.info("Set avatar thumbnail in embed")
+                logger.info("Set avatar thumbnail in embed")
             elif alt_data.get("avatarUrl"):  # Fallback to TRIGEN avatar if available
                 embed.set_thumbnail(url=alt_data.get("avatarUrl"))
-                self.logger.info("Used TRIGEN avatar URL")
+                logger.info("Used TRIGEN avatar URL")
             else:
-                self.logger.warning("No avatar URL available")
+                logger.warning("No avatar URL available")
 
             # Fetch actual Roblox account creation date
             creation_date_added = False
             if user_id:
                 try:
                     import aiohttp
-                    self.logger.info(f"Fetching creation date for user ID: {user_id}")
+                    logger.info(f"Fetching creation date for user ID: {user_id}")
                     async with aiohttp.ClientSession() as session:
                         # Get user details including creation date from Roblox API
                         async with session.get(f"https://users.roblox.com/v1/users/{user_id}") as resp:
@@ -331,13 +435,13 @@ class AdminCog(commands.Cog):
                                         parsed_date = datetime.strptime(created_date, "%Y-%m-%dT%H:%M:%S.%fZ")
                                         embed.add_field(name="📅 Creation Date", value=parsed_date.strftime('%m/%d/%Y'), inline=True)
                                         creation_date_added = True
-                                        self.logger.info(f"Found creation date: {parsed_date.strftime('%m/%d/%Y')}")
+                                        logger.info(f"Found creation date: {parsed_date.strftime('%m/%d/%Y')}")
                                     except ValueError as e:
-                                        self.logger.warning(f"Failed to parse creation date: {e}")
+                                        logger.warning(f"Failed to parse creation date: {e}")
                             else:
-                                self.logger.warning(f"User details API returned status {resp.status}")
+                                logger.warning(f"User details API returned status {resp.status}")
                 except Exception as e:
-                    self.logger.warning(f"Failed to fetch Roblox creation date: {e}")
+                    logger.warning(f"Failed to fetch Roblox creation date: {e}")
             
             # Try to parse creation date from TRIGEN if Roblox API failed
             if not creation_date_added and (created_at := alt_data.get("createdAt")):
@@ -376,7 +480,7 @@ class AdminCog(commands.Cog):
                 public_embed = discord.Embed(
                     title="🎉 Roblox Account Generated!",
                     description=f"✅ Account successfully generated and sent to {ctx.author.mention}'s DMs!",
-                    color=discord.Color.green()
+                    color=EMBED_COLOR
                 )
                 public_embed.set_footer(text="Check your DMs for account details")
                 await ctx.send(embed=public_embed)  # Remove ephemeral=True to make it public
@@ -396,9 +500,9 @@ class AdminCog(commands.Cog):
                 )
                 error_embed.set_footer(text="TRIGEN API • Token Balance: 0")
                 await ctx.send(embed=error_embed, ephemeral=True)
-                self.logger.warning("TRIGEN API tokens exhausted")
+                logger.warning("TRIGEN API tokens exhausted")
             else:
-                self.logger.error(f"Alt generation failed with RuntimeError: {e}")
+                logger.error(f"Alt generation failed with RuntimeError: {e}")
                 await ctx.send("❌ An unexpected error occurred. Please try again later.", ephemeral=True)
         except httpx.HTTPStatusError as e:
             # Handle HTTP errors from TRIGEN API more specifically
@@ -411,7 +515,7 @@ class AdminCog(commands.Cog):
                 )
                 error_embed.set_footer(text="TRIGEN API • Token Balance: 0")
                 await ctx.send(embed=error_embed, ephemeral=True)
-                self.logger.warning(f"TRIGEN API quota exhausted - HTTP {e.response.status_code}")
+                logger.warning(f"TRIGEN API quota exhausted - HTTP {e.response.status_code}")
             elif e.response.status_code == 403:
                 # Check if 403 is due to token exhaustion
                 response_text = e.response.text.lower()
@@ -424,15 +528,15 @@ class AdminCog(commands.Cog):
                     )
                     error_embed.set_footer(text="TRIGEN API • Token Balance: 0")
                     await ctx.send(embed=error_embed, ephemeral=True)
-                    self.logger.warning(f"TRIGEN API quota exhausted - HTTP 403: {response_text}")
+                    logger.warning(f"TRIGEN API quota exhausted - HTTP 403: {response_text}")
                 else:
-                    self.logger.error(f"TRIGEN API forbidden error: {e}")
+                    logger.error(f"TRIGEN API forbidden error: {e}")
                     await ctx.send("❌ API access denied. Please contact the bot administrator.", ephemeral=True)
             else:
-                self.logger.error(f"TRIGEN API HTTP error: {e}")
+                logger.error(f"TRIGEN API HTTP error: {e}")
                 await ctx.send("❌ API service temporarily unavailable. Please try again later.", ephemeral=True)
         except Exception as e:
-            self.logger.error(f"Alt generation failed with unexpected error: {e}")
+            logger.error(f"Alt generation failed with unexpected error: {e}")
             await ctx.send("❌ An unexpected error occurred. Please try again later.", ephemeral=True)
 
     # =========================================================
@@ -472,13 +576,8 @@ class AdminCog(commands.Cog):
             await ctx.send("No users are whitelisted for the alt command.", ephemeral=True)
             return
 
-        mentions = []
-        for uid in ids:
-            try:
-                user = ctx.guild.get_member(uid) or await self.bot.fetch_user(uid)
-                mentions.append(user.mention if user else f"<@{uid}>")
-            except:
-                mentions.append(f"<@{uid}>")
+        # User.mention is just <@id>; no need to fetch each user over the API
+        mentions = [f"<@{uid}>" for uid in ids]
 
         await ctx.send(f"**Alt Whitelisted Users:** {', '.join(mentions)}", 
                       allowed_mentions=self.no_pings, ephemeral=True)
@@ -490,12 +589,9 @@ class AdminCog(commands.Cog):
     @app_commands.command(name="alt_role_add", description="Whitelist a role for alt command")
     @app_commands.describe(role="Role to whitelist")
     @app_commands.guild_only()
+    @app_commands.checks.has_permissions(manage_guild=True)
     async def alt_role_add(self, interaction: discord.Interaction, role: discord.Role):
         """Add a role to the alt whitelist."""
-        if not interaction.user.guild_permissions.manage_guild:
-            await interaction.response.send_message("❌ You need **Manage Server** permission.", ephemeral=True)
-            return
-
         self._add_alt_role(interaction.guild.id, role.id)
         await interaction.response.send_message(
             f"✅ {role.mention} has been whitelisted for the alt command.",
@@ -506,24 +602,18 @@ class AdminCog(commands.Cog):
     @app_commands.command(name="alt_role_remove", description="Remove a role from alt whitelist")
     @app_commands.describe(role="Role to remove")
     @app_commands.guild_only()
+    @app_commands.checks.has_permissions(manage_guild=True)
     async def alt_role_remove(self, interaction: discord.Interaction, role: discord.Role):
         """Remove a role from the alt whitelist."""
-        if not interaction.user.guild_permissions.manage_guild:
-            await interaction.response.send_message("❌ You need **Manage Server** permission.", ephemeral=True)
-            return
-
         removed = self._remove_alt_role(interaction.guild.id, role.id)
         msg = f"✅ Removed {role.mention} from whitelist." if removed else f"ℹ️ {role.mention} wasn't whitelisted."
         await interaction.response.send_message(msg, allowed_mentions=self.no_pings, ephemeral=True)
 
     @app_commands.command(name="alt_role_list", description="Show roles whitelisted for alt command")
     @app_commands.guild_only()
+    @app_commands.checks.has_permissions(manage_guild=True)
     async def alt_role_list(self, interaction: discord.Interaction):
         """Show roles whitelisted for alt command."""
-        if not interaction.user.guild_permissions.manage_guild:
-            await interaction.response.send_message("❌ You need **Manage Server** permission.", ephemeral=True)
-            return
-
         await interaction.response.defer(ephemeral=True)
 
         role_ids = self._get_alt_role_ids(interaction.guild.id)
@@ -531,13 +621,11 @@ class AdminCog(commands.Cog):
             await interaction.followup.send("No roles are whitelisted for the alt command.", ephemeral=True)
             return
 
-        mentions = []
-        for role_id in role_ids:
-            role = interaction.guild.get_role(role_id)
-            mentions.append(role.mention if role else f"<@&{role_id}>")
+        # Role.mention is just <@&id>, so no need to resolve each role
+        mentions = ", ".join(f"<@&{role_id}>" for role_id in role_ids)
 
         await interaction.followup.send(
-            f"**Alt Whitelisted Roles:** {', '.join(mentions)}",
+            f"**Alt Whitelisted Roles:** {mentions}",
             allowed_mentions=self.no_pings,
             ephemeral=True
         )
@@ -549,12 +637,9 @@ class AdminCog(commands.Cog):
     @app_commands.command(name="mod_add", description="Add a role to mod whitelist")
     @app_commands.describe(role="Role to add to mod whitelist")
     @app_commands.guild_only()
+    @app_commands.checks.has_permissions(administrator=True)
     async def mod_add(self, interaction: discord.Interaction, role: discord.Role):
         """Add a role to the mod whitelist."""
-        if not interaction.user.guild_permissions.administrator:
-            await interaction.response.send_message("❌ You need **Administrator** permission.", ephemeral=True)
-            return
-
         self.bot.add_mod_role(interaction.guild.id, role.id)
         await interaction.response.send_message(
             f"✅ {role.mention} added to mod whitelist.",
@@ -565,12 +650,9 @@ class AdminCog(commands.Cog):
     @app_commands.command(name="mod_remove", description="Remove a role from mod whitelist")
     @app_commands.describe(role="Role to remove from mod whitelist")
     @app_commands.guild_only()
+    @app_commands.checks.has_permissions(administrator=True)
     async def mod_remove(self, interaction: discord.Interaction, role: discord.Role):
         """Remove a role from the mod whitelist."""
-        if not interaction.user.guild_permissions.administrator:
-            await interaction.response.send_message("❌ You need **Administrator** permission.", ephemeral=True)
-            return
-
         removed = self.bot.remove_mod_role(interaction.guild.id, role.id)
         if removed:
             await interaction.response.send_message(
@@ -591,43 +673,23 @@ class AdminCog(commands.Cog):
     @commands.has_permissions(administrator=True)
     async def add_mod(self, ctx: commands.Context, target: Union[discord.Member, discord.Role]):
         """Add a user or role to the mod whitelist for all bot commands (except alt)."""
+        description = f"**{target.mention}** now has access to all bot commands (except alt generation)."
+        footer = f"Added by {ctx.author.display_name}"
         if isinstance(target, discord.Role):
             # Add role to mod whitelist
             self.bot.add_mod_role(ctx.guild.id, target.id)
-            embed = discord.Embed(
-                title="✅ Mod Role Added",
-                description=f"**{target.mention}** now has access to all bot commands (except alt generation).",
-                color=discord.Color.green(),
-                timestamp=discord.utils.utcnow()
-            )
-            embed.add_field(
-                name="📋 Permissions Granted",
-                value="• All moderation commands\n• All utility commands\n• Admin commands (if admin)\n• ❌ Alt generation (excluded)",
-                inline=False
-            )
-            embed.set_footer(text=f"Added by {ctx.author.display_name}")
+            embed = self._from_template(self._MOD_ADDED_TEMPLATE, "✅ Mod Role Added", description, footer)
             
         elif isinstance(target, discord.Member):
             # Add user directly to mod whitelist (no role assignment needed)
             self.bot.add_mod_user(ctx.guild.id, target.id)
             
-            embed = discord.Embed(
-                title="✅ User Added to Mod Team",
-                description=f"**{target.mention}** now has access to all bot commands (except alt generation).",
-                color=discord.Color.green(),
-                timestamp=discord.utils.utcnow()
-            )
-            embed.add_field(
-                name="📋 Permissions Granted",
-                value="• All moderation commands\n• All utility commands\n• Admin commands (if admin)\n• ❌ Alt generation (excluded)",
-                inline=False
-            )
+            embed = self._from_template(self._MOD_ADDED_TEMPLATE, "✅ User Added to Mod Team", description, footer)
             embed.add_field(
                 name="ℹ️ Note",
                 value="User permissions are managed by the bot internally. No Discord role assignment required.",
                 inline=False
             )
-            embed.set_footer(text=f"Added by {ctx.author.display_name}")
         
         await ctx.send(embed=embed, ephemeral=True)
     @commands.hybrid_command(name="removemod", description="Remove a user or role from mod whitelist")
@@ -636,22 +698,13 @@ class AdminCog(commands.Cog):
     @commands.has_permissions(administrator=True)
     async def remove_mod(self, ctx: commands.Context, target: Union[discord.Member, discord.Role]):
         """Remove a user or role from the mod whitelist."""
+        description = f"**{target.mention}** no longer has mod access to bot commands."
+        footer = f"Removed by {ctx.author.display_name}"
         if isinstance(target, discord.Role):
             # Remove role from mod whitelist
             removed = self.bot.remove_mod_role(ctx.guild.id, target.id)
             if removed:
-                embed = discord.Embed(
-                    title="✅ Mod Role Removed",
-                    description=f"**{target.mention}** no longer has mod access to bot commands.",
-                    color=discord.Color.red(),
-                    timestamp=discord.utils.utcnow()
-                )
-                embed.add_field(
-                    name="📋 Permissions Revoked",
-                    value="• All moderation commands\n• All utility commands\n• Admin commands (unless admin)",
-                    inline=False
-                )
-                embed.set_footer(text=f"Removed by {ctx.author.display_name}")
+                embed = self._from_template(self._MOD_REMOVED_TEMPLATE, "✅ Mod Role Removed", description, footer)
             else:
                 embed = discord.Embed(
                     title="ℹ️ Role Not Found",
@@ -663,18 +716,7 @@ class AdminCog(commands.Cog):
             # Remove user from mod whitelist
             removed = self.bot.remove_mod_user(ctx.guild.id, target.id)
             if removed:
-                embed = discord.Embed(
-                    title="✅ User Removed from Mod Team",
-                    description=f"**{target.mention}** no longer has mod access to bot commands.",
-                    color=discord.Color.red(),
-                    timestamp=discord.utils.utcnow()
-                )
-                embed.add_field(
-                    name="� Permissions Revoked",
-                    value="• All moderation commands\n• All utility commands\n• Admin commands (unless admin)",
-                    inline=False
-                )
-                embed.set_footer(text=f"Removed by {ctx.author.display_name}")
+                embed = self._from_template(self._MOD_REMOVED_TEMPLATE, "✅ User Removed from Mod Team", description, footer)
             else:
                 embed = discord.Embed(
                     title="ℹ️ User Not Found",
@@ -707,30 +749,29 @@ class AdminCog(commands.Cog):
             description_parts = []
             
             if mod_roles:
-                role_list = []
-                for role_id in mod_roles:
-                    role = ctx.guild.get_role(role_id)
-                    if role:
-                        member_count = len(role.members)
-                        role_list.append(f"• {role.mention} ({member_count} members)")
-                    else:
-                        role_list.append(f"• ~~Deleted Role~~ (ID: {role_id})")
-                description_parts.append(f"**{len(mod_roles)} role(s):**\n" + "\n".join(role_list))
+                # One get_role lookup per ID, resolved and deleted roles in the same pass
+                role_list = "\n".join(
+                    f"• {role.mention} ({len(role.members)} members)"
+                    if (role := ctx.guild.get_role(role_id))
+                    else f"• ~~Deleted Role~~ (ID: {role_id})"
+                    for role_id in mod_roles
+                )
+                description_parts.append(f"**{len(mod_roles)} role(s):**\n{role_list}")
             
             if mod_users:
-                user_list = []
-                for user_id in mod_users:
-                    user = ctx.guild.get_member(user_id)
-                    if user:
-                        user_list.append(f"• {user.mention}")
-                    else:
-                        user_list.append(f"• ~~Left Server~~ (ID: {user_id})")
-                description_parts.append(f"**{len(mod_users)} user(s):**\n" + "\n".join(user_list))
+                # Mentions render from the ID alone; only check whether they're still here
+                user_list = "\n".join(
+                    f"• <@{user_id}>"
+                    if ctx.guild.get_member(user_id)
+                    else f"• ~~Left Server~~ (ID: {user_id})"
+                    for user_id in mod_users
+                )
+                description_parts.append(f"**{len(mod_users)} user(s):**\n{user_list}")
             
             embed = discord.Embed(
                 title="📋 Mod Whitelist",
                 description="\n\n".join(description_parts),
-                color=discord.Color.green(),
+                color=EMBED_COLOR,
                 timestamp=discord.utils.utcnow()
             )
             embed.add_field(
@@ -765,57 +806,98 @@ class AdminCog(commands.Cog):
         roles = set()
         # Try to get from bot's persistent storage if available
         try:
-            if hasattr(self.bot, "get_alt_roles"):
-                roles.update(self.bot.get_alt_roles(guild_id))
+            if self._persist_get_alt_roles:
+                roles.update(self._persist_get_alt_roles(guild_id))
         except Exception as e:
-            self.logger.error(f"Failed to get alt roles from persistent storage: {e}")
+            logger.error(f"Failed to get alt roles from persistent storage: {e}")
         
         # Fallback to in-memory storage
-        store = getattr(self.bot, "_alt_role_whitelist", None)
-        if store is None:
-            store = {}
-            setattr(self.bot, "_alt_role_whitelist", store)
-        roles.update(store.get(guild_id, set()))
+        roles.update(self._alt_role_store.get(guild_id, ()))
         return roles
 
     def _add_alt_role(self, guild_id: int, role_id: int) -> None:
         """Add a role to alt whitelist."""
-        if hasattr(self.bot, "add_alt_role"):
+        if self._persist_add_alt_role:
             try:
-                self.bot.add_alt_role(guild_id, role_id)
+                self._persist_add_alt_role(guild_id, role_id)
             except Exception:
                 pass
         
         # Also store in memory as backup
-        store = getattr(self.bot, "_alt_role_whitelist", None)
-        if store is None:
-            store = {}
-            setattr(self.bot, "_alt_role_whitelist", store)
-        store.setdefault(guild_id, set()).add(role_id)
+        self._alt_role_store[guild_id].add(role_id)
 
     def _remove_alt_role(self, guild_id: int, role_id: int) -> bool:
         """Remove a role from alt whitelist."""
         removed = False
         
-        if hasattr(self.bot, "remove_alt_role"):
+        if self._persist_remove_alt_role:
             try:
-                removed = bool(self.bot.remove_alt_role(guild_id, role_id))
+                removed = bool(self._persist_remove_alt_role(guild_id, role_id))
             except Exception:
                 removed = False
         
         # Also remove from memory storage
-        store = getattr(self.bot, "_alt_role_whitelist", None)
-        if store and guild_id in store and role_id in store[guild_id]:
-            store[guild_id].remove(role_id)
+        roles = self._alt_role_store.get(guild_id)
+        if roles and role_id in roles:
+            roles.remove(role_id)
             removed = True
             
         return removed
 
+    @staticmethod
+    def _from_template(template: discord.Embed, title: str, description: str, footer: str) -> discord.Embed:
+        """Copy an embed template and fill in the per-use parts."""
+        embed = template.copy()
+        embed.title = title
+        embed.description = description
+        embed.timestamp = discord.utils.utcnow()
+        embed.set_footer(text=footer)
+        return embed
+
+    def _has_say_role(self, member: discord.Member) -> bool:
+        """Check if member has any of the allowed /say roles."""
+        # Member._roles is a sorted SnowflakeList whose has() bisects; Member.roles
+        # rebuilds a list of Role objects on every access.
+        role_ids = getattr(member, "_roles", None)  # noqa: SLF001
+        if role_ids is not None:
+            return any(role_ids.has(rid) for rid in self.allowed_say_roles)
+        member_role_ids = {role.id for role in member.roles}
+        return any(rid in member_role_ids for rid in self.allowed_say_roles)
+
     def _member_has_alt_role(self, member: discord.Member) -> bool:
         """Check if member has any alt-whitelisted roles."""
         allowed_roles = self._get_alt_role_ids(member.guild.id)
         return any(role.id in allowed_roles for role in member.roles)
 
+    def _queue_delete(self, message: discord.Message) -> None:
+        """Queue a command message for the next bulk delete."""
+        self._pending_deletes[message.channel.id].append(message)
+
+    @tasks.loop(seconds=0.5)
+    async def flush_pending_deletes(self):
+        """Delete queued command messages, up to 100 per channel per request."""
+        while self._pending_deletes:
+            _, messages = self._pending_deletes.popitem()
+            channel = messages[0].channel
+            # DM channels and the like have no bulk delete; remove those one by one
+            can_bulk = hasattr(channel, "delete_messages")
+            for i in range(0, len(messages), 100):
+                batch = messages[i:i + 100]
+                if can_bulk:
+                    try:
+                        # Fresh command messages are always inside the 14 day bulk-delete window
+                        await channel.delete_messages(batch)
+                        continue
+                    except discord.HTTPException:
+                        pass
+                for msg in batch:
+                    try:
+                        await msg.delete()
+                    except (discord.NotFound, discord.Forbidden):
+                        pass
+                    except discord.HTTPException as e:
+                        logger.debug(f"Failed to delete command message {msg.id}: {e}")
+
     # =========================================================
     # SAY COMMANDS
     # =========================================================
@@ -827,11 +909,20 @@ class AdminCog(commands.Cog):
             return
         
         # Check permissions
-        has_role = any((role.id in self.allowed_say_roles) for role in ctx.author.roles)
+        has_role = self._has_say_role(ctx.author)
         if not has_role:
-            await ctx.message.delete()
-            response = await ctx.send("❌ You don't have access to this command.")
-            await response.delete(delay=5)
+            self._queue_delete(ctx.message)
+            await ctx.send("❌ You don't have access to this command.", delete_after=5)
+            return
+        
+        # Check our own channel permissions up front instead of waiting for a 403
+        perms = ctx.channel.permissions_for(ctx.guild.me)
+        if not perms.send_messages:
+            logger.warning(f"Say command ignored: no send permission in #{ctx.channel} ({ctx.guild.name})")
+            return
+        if ctx.message.attachments and not perms.attach_files:
+            self._queue_delete(ctx.message)
+            await ctx.send("❌ I don't have permission to attach files here.", delete_after=5)
             return
         
         # Get attachments from the command message
@@ -841,25 +932,23 @@ class AdminCog(commands.Cog):
                 data = await attachment.read()
                 files.append(discord.File(io.BytesIO(data), filename=attachment.filename))
             except Exception as e:
-                self.logger.error(f"Failed to process attachment: {e}")
+                logger.error(f"Failed to process attachment: {e}")
                 continue
         
         # Check if message or attachments are provided
         content = message.strip() if message else None
         if not content and not files:
-            await ctx.message.delete()
-            response = await ctx.send("❌ Please provide a message or attach files. Usage: `!say <message>` or attach images/files")
-            await response.delete(delay=5)
+            self._queue_delete(ctx.message)
+            await ctx.send("❌ Please provide a message or attach files. Usage: `!say <message>` or attach images/files", delete_after=5)
             return
             
         try:
             # Delete command message
-            await ctx.message.delete()
+            self._queue_delete(ctx.message)
             
             # Send the message with attachments
-            allowed = discord.AllowedMentions(everyone=False, users=True, roles=True)
-            await ctx.channel.send(content=content, files=files or None, allowed_mentions=allowed)
-            self.logger.info(f"Say command used by {ctx.author} in {ctx.guild.name}")
+            await ctx.channel.send(content=content, files=files or None, allowed_mentions=self.default_allowed)
+            logger.info(f"Say command used by {ctx.author} in {ctx.guild.name}")
             
         except discord.Forbidden:
             await ctx.send("❌ I don't have permission to send messages here.")
@@ -892,37 +981,55 @@ class AdminCog(commands.Cog):
             await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
             return
 
-        has_role = any((role.id in self.allowed_say_roles) for role in interaction.user.roles)
+        has_role = self._has_say_role(interaction.user)
         if not has_role:
             await interaction.response.send_message("❌ You don't have access to `/say`.", ephemeral=True)
             return
 
+        ack_started = asyncio.get_running_loop().time()
         target = channel or interaction.channel
 
+        # Check our own channel permissions up front instead of waiting for a 403
+        perms = target.permissions_for(interaction.guild.me)
+        has_files = any(a is not None for a in (file1, file2, file3, file4, file5))
+        if not perms.send_messages or (has_files and not perms.attach_files):
+            await interaction.response.send_message("❌ I don't have permission to send messages in that channel.", ephemeral=True)
+            return
+
+        # Downloads can take a while - acknowledge the interaction first
+        await interaction.response.defer(ephemeral=True)
+        ack_ms = (asyncio.get_running_loop().time() - ack_started) * 1000
+        if ack_ms > 2500:
+            logger.warning(f"Say command ACK took {ack_ms:.0f} ms (Discord limit is 3000 ms)")
+
+        # Fetch all attachments concurrently
         atts = [a for a in (file1, file2, file3, file4, file5) if a is not None]
-        files: list[discord.File] = []
-        for a in atts:
-            try:
-                data = await a.read()
-                files.append(discord.File(io.BytesIO(data), filename=a.filename))
-            except Exception:
-                pass
+        results = await asyncio.gather(*(a.to_file() for a in atts), return_exceptions=True)
+        files: list[discord.File] = [f for f in results if not isinstance(f, BaseException)]
 
         content = message.strip() or None
         if not content and not files:
-            await interaction.response.send_message("❌ Nothing to send. Add text or attach at least one file.", ephemeral=True)
+            await interaction.followup.send("❌ Nothing to send. Add text or attach at least one file.", ephemeral=True)
             return
 
-        self.logger.info(f"Say command used by {interaction.user} in {interaction.guild.name}")
+        logger.info(f"Say command used by {interaction.user} in {interaction.guild.name}")
 
-        try:
-            allowed = discord.AllowedMentions(everyone=False, users=True, roles=True)
-            await target.send(content=content, files=files or None, allowed_mentions=allowed)
-            await interaction.response.send_message("✅ Message sent!", ephemeral=True)
-        except discord.Forbidden:
-            await interaction.response.send_message("❌ I don't have permission to send messages in that channel.", ephemeral=True)
-        except Exception as e:
-            await interaction.response.send_message(f"❌ Failed to send: {e}", ephemeral=True)
+        # Post the message and the confirmation concurrently; they hit
+        # different endpoints. The confirmation is corrected on failure.
+        sent, confirm = await asyncio.gather(
+            target.send(content=content, files=files or None, allowed_mentions=self.default_allowed),
+            interaction.followup.send("✅ Message sent!", ephemeral=True, wait=True),
+            return_exceptions=True,
+        )
+        if isinstance(sent, BaseException):
+            if isinstance(sent, discord.Forbidden):
+                error_msg = "❌ I don't have permission to send messages in that channel."
+            else:
+                error_msg = f"❌ Failed to send: {sent}"
+            if isinstance(confirm, discord.WebhookMessage):
+                await confirm.edit(content=error_msg)
+            else:
+                await interaction.followup.send(error_msg, ephemeral=True)
 
     # =========================================================
     # ROLE MANAGEMENT COMMANDS
@@ -935,32 +1042,28 @@ class AdminCog(commands.Cog):
             return
         
         # Check permissions
-        has_role = any((role_check.id in self.allowed_say_roles) for role_check in ctx.author.roles)
-        if not has_role and not ctx.author.guild_permissions.manage_roles:
-            await ctx.message.delete()
-            response = await ctx.send("❌ You don't have permission to manage roles.")
-            await response.delete(delay=5)
+        has_role = self._has_say_role(ctx.author)
+        if not has_role and not (ctx.author.guild_permissions.value & MANAGE_ROLES_OR_ADMIN):
+            self._queue_delete(ctx.message)
+            await ctx.send("❌ You don't have permission to manage roles.", delete_after=5)
             return
             
         try:
             # Delete command message
-            await ctx.message.delete()
+            self._queue_delete(ctx.message)
             
             # Check if member already has the role
             if role in member.roles:
-                response = await ctx.send(f"❌ {member.display_name} already has the {role.name} role.")
-                await response.delete(delay=5)
+                await ctx.send(f"❌ {member.display_name} already has the {role.name} role.", delete_after=5)
                 return
             
             # Check role hierarchy
             if role >= ctx.guild.me.top_role:
-                response = await ctx.send(f"❌ I cannot manage the {role.name} role due to role hierarchy.")
-                await response.delete(delay=5)
+                await ctx.send(f"❌ I cannot manage the {role.name} role due to role hierarchy.", delete_after=5)
                 return
             
             if ctx.author != ctx.guild.owner and role >= ctx.author.top_role:
-                response = await ctx.send(f"❌ You cannot assign the {role.name} role due to role hierarchy.")
-                await response.delete(delay=5)
+                await ctx.send(f"❌ You cannot assign the {role.name} role due to role hierarchy.", delete_after=5)
                 return
             
             # Add the role
@@ -969,17 +1072,15 @@ class AdminCog(commands.Cog):
             # Send success message
             embed = discord.Embed(
                 description=f"✅ Successfully added **{role.name}** role to {member.mention}",
-                color=discord.Color.green()
+                color=EMBED_COLOR
             )
             await ctx.send(embed=embed, delete_after=10)
-            self.logger.info(f"Role {role.name} added to {member} by {ctx.author} in {ctx.guild.name}")
+            logger.info(f"Role {role.name} added to {member} by {ctx.author} in {ctx.guild.name}")
             
         except discord.Forbidden:
-            response = await ctx.send("❌ I don't have permission to manage roles.")
-            await response.delete(delay=5)
+            await ctx.send("❌ I don't have permission to manage roles.", delete_after=5)
         except Exception as e:
-            response = await ctx.send(f"❌ Failed to add role: {e}")
-            await response.delete(delay=5)
+            await ctx.send(f"❌ Failed to add role: {e}", delete_after=5)
 
     @app_commands.command(name="addrole", description="Add a role to a member")
     @app_commands.describe(
@@ -994,8 +1095,8 @@ class AdminCog(commands.Cog):
             return
 
         # Check permissions
-        has_role = any((role_check.id in self.allowed_say_roles) for role_check in interaction.user.roles)
-        if not has_role and not interaction.user.guild_permissions.manage_roles:
+        has_role = self._has_say_role(interaction.user)
+        if not has_role and not (interaction.user.guild_permissions.value & MANAGE_ROLES_OR_ADMIN):
             await interaction.response.send_message("❌ You don't have permission to manage roles.", ephemeral=True)
             return
 
@@ -1020,12 +1121,12 @@ class AdminCog(commands.Cog):
             # Send success message
             embed = discord.Embed(
                 description=f"✅ Successfully added **{role.name}** role to {member.mention}",
-                color=discord.Color.green()
+                color=EMBED_COLOR
             )
             embed.set_footer(text=f"Added by {interaction.user.display_name}")
             
             await interaction.response.send_message(embed=embed)
-            self.logger.info(f"Role {role.name} added to {member} by {interaction.user} in {interaction.guild.name}")
+            logger.info(f"Role {role.name} added to {member} by {interaction.user} in {interaction.guild.name}")
             
         except discord.Forbidden:
             await interaction.response.send_message("❌ I don't have permission to manage roles.", ephemeral=True)
@@ -1040,41 +1141,36 @@ class AdminCog(commands.Cog):
             return
 
         # Check permissions
-        has_role = any((role_check.id in self.allowed_say_roles)
-                       for role_check in ctx.author.roles)
-        if not has_role and not ctx.author.guild_permissions.manage_roles:
-            await ctx.message.delete()
-            response = await ctx.send(
-                "❌ You don't have permission to manage roles.")
-            await response.delete(delay=5)
+        has_role = self._has_say_role(ctx.author)
+        if not has_role and not (ctx.author.guild_permissions.value & MANAGE_ROLES_OR_ADMIN):
+            self._queue_delete(ctx.message)
+            await ctx.send(
+                "❌ You don't have permission to manage roles.", delete_after=5)
             return
 
         try:
             # Delete command message
-            await ctx.message.delete()
+            self._queue_delete(ctx.message)
 
             # Check if member doesn't have the role
             if role not in member.roles:
-                response = await ctx.send(
+                await ctx.send(
                     f"❌ {member.display_name} doesn't have "
-                    f"the {role.name} role.")
-                await response.delete(delay=5)
+                    f"the {role.name} role.", delete_after=5)
                 return
 
             # Check role hierarchy
             if role >= ctx.guild.me.top_role:
-                response = await ctx.send(
+                await ctx.send(
                     f"❌ I cannot manage the {role.name} role "
-                    f"due to role hierarchy.")
-                await response.delete(delay=5)
+                    f"due to role hierarchy.", delete_after=5)
                 return
 
             if (ctx.author != ctx.guild.owner and
                     role >= ctx.author.top_role):
-                response = await ctx.send(
+                await ctx.send(
                     f"❌ You cannot remove the {role.name} role "
-                    f"due to role hierarchy.")
-                await response.delete(delay=5)
+                    f"due to role hierarchy.", delete_after=5)
                 return
 
             # Remove the role
@@ -1085,20 +1181,18 @@ class AdminCog(commands.Cog):
             embed = discord.Embed(
                 description=(f"✅ Successfully removed **{role.name}** "
                              f"role from {member.mention}"),
-                color=discord.Color.green()
+                color=EMBED_COLOR
             )
             await ctx.send(embed=embed, delete_after=10)
-            self.logger.info(
+            logger.info(
                 f"Role {role.name} removed from {member} by {ctx.author} "
                 f"in {ctx.guild.name}")
 
         except discord.Forbidden:
-            response = await ctx.send(
-                "❌ I don't have permission to manage roles.")
-            await response.delete(delay=5)
+            await ctx.send(
+                "❌ I don't have permission to manage roles.", delete_after=5)
         except Exception as e:
-            response = await ctx.send(f"❌ Failed to remove role: {e}")
-            await response.delete(delay=5)
+            await ctx.send(f"❌ Failed to remove role: {e}", delete_after=5)
 
     @app_commands.command(name="removerole",
                           description="Remove a role from a member")
@@ -1117,10 +1211,9 @@ class AdminCog(commands.Cog):
             return
 
         # Check permissions
-        has_role = any((role_check.id in self.allowed_say_roles)
-                       for role_check in interaction.user.roles)
+        has_role = self._has_say_role(interaction.user)
         if (not has_role and
-                not interaction.user.guild_permissions.manage_roles):
+                not (interaction.user.guild_permissions.value & MANAGE_ROLES_OR_ADMIN)):
             await interaction.response.send_message(
                 "❌ You don't have permission to manage roles.",
                 ephemeral=True)
@@ -1156,13 +1249,13 @@ class AdminCog(commands.Cog):
             embed = discord.Embed(
                 description=(f"✅ Successfully removed **{role.name}** "
                              f"role from {member.mention}"),
-                color=discord.Color.green()
+                color=EMBED_COLOR
             )
             embed.set_footer(
                 text=f"Removed by {interaction.user.display_name}")
 
             await interaction.response.send_message(embed=embed)
-            self.logger.info(
+            logger.info(
                 f"Role {role.name} removed from {member} by "
                 f"{interaction.user} in {interaction.guild.name}")
 
@@ -1188,10 +1281,7 @@ class AdminCog(commands.Cog):
         """Change a member's nickname."""
         # Delete command message for prefix commands
         if not ctx.interaction:
-            try:
-                await ctx.message.delete()
-            except (discord.NotFound, discord.Forbidden):
-                pass
+            self._queue_delete(ctx.message)
 
         # Check if this is a guild context
         if not isinstance(ctx.author, discord.Member):
@@ -1199,8 +1289,8 @@ class AdminCog(commands.Cog):
             return
 
         # Check permissions
-        has_role = any((role_check.id in self.allowed_say_roles) for role_check in ctx.author.roles)
-        if not has_role and not ctx.author.guild_permissions.manage_nicknames:
+        has_role = self._has_say_role(ctx.author)
+        if not has_role and not (ctx.author.guild_permissions.value & MANAGE_NICKNAMES_OR_ADMIN):
             await ctx.send("❌ You don't have permission to manage nicknames.", ephemeral=True)
             return
 
@@ -1222,20 +1312,20 @@ class AdminCog(commands.Cog):
                 embed = discord.Embed(
                     title="✅ Nickname Changed",
                     description=f"Changed {member.mention}'s nickname from **{old_nick}** to **{nickname}**",
-                    color=discord.Color.green()
+                    color=EMBED_COLOR
                 )
             else:
                 embed = discord.Embed(
                     title="✅ Nickname Removed",
                     description=f"Removed {member.mention}'s nickname (was **{old_nick}**)",
-                    color=discord.Color.green()
+                    color=EMBED_COLOR
                 )
             
             embed.set_footer(text=f"Changed by {ctx.author.display_name}")
             await ctx.send(embed=embed, allowed_mentions=self.no_pings)
             
             # Log the action
-            self.logger.info(f"Nickname changed for {member} by {ctx.author} in {ctx.guild.name}: '{old_nick}' -> '{nickname}'")
+            logger.info(f"Nickname changed for {member} by {ctx.author} in {ctx.guild.name}: '{old_nick}' -> '{nickname}'")
             
         except discord.Forbidden:
             await ctx.send("❌ I don't have permission to manage nicknames.", ephemeral=True)
@@ -1253,10 +1343,7 @@ class AdminCog(commands.Cog):
         """Change the bot's command prefix."""
         # Delete command message for prefix commands
         if not ctx.interaction:
-            try:
-                await ctx.message.delete()
-            except (discord.NotFound, discord.Forbidden):
-                pass
+            self._queue_delete(ctx.message)
 
         # Check if this is a guild context
         if not isinstance(ctx.author, discord.Member):
@@ -1264,8 +1351,8 @@ class AdminCog(commands.Cog):
             return
 
         # Check permissions
-        has_role = any((role_check.id in self.allowed_say_roles) for role_check in ctx.author.roles)
-        if not has_role and not ctx.author.guild_permissions.manage_guild:
+        has_role = self._has_say_role(ctx.author)
+        if not has_role and not (ctx.author.guild_permissions.value & MANAGE_GUILD_OR_ADMIN):
             await ctx.send("❌ You need **Manage Server** permission or the allowed roles to change the prefix.", ephemeral=True)
             return
 
@@ -1298,7 +1385,7 @@ class AdminCog(commands.Cog):
             embed = discord.Embed(
                 title="✅ Prefix Changed",
                 description=f"Bot prefix changed from `{old_prefix}` to `{prefix}`\n\nYou can now use commands like `{prefix}ping` or `{prefix}help`",
-                color=discord.Color.green()
+                color=EMBED_COLOR
             )
             embed.add_field(
                 name="📝 Note", 
@@ -1310,7 +1397,7 @@ class AdminCog(commands.Cog):
             await ctx.send(embed=embed)
             
             # Log the action
-            self.logger.info(f"Prefix changed from '{old_prefix}' to '{prefix}' by {ctx.author} in {ctx.guild.name}")
+            logger.info(f"Prefix changed from '{old_prefix}' to '{prefix}' by {ctx.author} in {ctx.guild.name}")
             
         except Exception as e:
             await ctx.send(f"❌ Failed to change prefix: {e}", ephemeral=True)
@@ -1339,6 +1426,9 @@ class AdminCog(commands.Cog):
         attachment: discord.Attachment = None
     ):
         """Send a direct message to a user or all members with a role."""
+        # Reading attachments and DMing a whole role easily outlasts the 3s
+        # interaction ACK window (no-op for prefix invocations)
+        await ctx.defer(ephemeral=True)
         try:
             # Get attachments from both slash commands and prefix commands
             # IMPORTANT: Read attachments BEFORE deleting the message!
@@ -1362,12 +1452,7 @@ class AdminCog(commands.Cog):
             
             # NOW delete the command message for prefix commands (after reading attachments)
             if not ctx.interaction:
-                try:
-                    await ctx.message.delete()
-                except discord.NotFound:
-                    pass  # Message already deleted
-                except discord.Forbidden:
-                    pass  # No permission to delete
+                self._queue_delete(ctx.message)
             
             # Check if we have either message or attachments
             if not message and not attachment_data:
@@ -1378,7 +1463,7 @@ class AdminCog(commands.Cog):
                     await ctx.send(
                         error_msg, 
                         delete_after=3, 
-                        allowed_mentions=discord.AllowedMentions.none()
+                        allowed_mentions=self.no_pings
                     )
                 return
             
@@ -1395,7 +1480,7 @@ class AdminCog(commands.Cog):
                         await ctx.send(
                             f"❌ No members found with the role **{target.name}**.", 
                             delete_after=3, 
-                            allowed_mentions=discord.AllowedMentions.none()
+                            allowed_mentions=self.no_pings
                         )
                     return
                 
@@ -1435,10 +1520,10 @@ class AdminCog(commands.Cog):
                     await ctx.send(summary, ephemeral=True)
                 else:
                     # Use allowed_mentions to prevent any accidental role pings
-                    await ctx.send(summary, delete_after=10, allowed_mentions=discord.AllowedMentions.none())
+                    await ctx.send(summary, delete_after=10, allowed_mentions=self.no_pings)
                 
                 # Log the action
-                self.logger.info(
+                logger.info(
                     "Role DM sent to %s members with role %s by %s in %s: %s (Success: %d, Failed: %d)",
                     total_members,
                     target.name,
@@ -1484,11 +1569,11 @@ class AdminCog(commands.Cog):
                         await ctx.send(
                             f"✅ Direct message sent to **{target.display_name}**{attachment_info}!",
                             delete_after=1,
-                            allowed_mentions=discord.AllowedMentions.none()
+                            allowed_mentions=self.no_pings
                         )
                     
                     # Log the action
-                    self.logger.info(
+                    logger.info(
                         "User DM sent to %s by %s in %s: %s (Attachments: %d)",
                         target,
                         ctx.author,
@@ -1502,13 +1587,13 @@ class AdminCog(commands.Cog):
                     if ctx.interaction:
                         await ctx.send(error_msg, ephemeral=True)
                     else:
-                        await ctx.send(error_msg, delete_after=5, allowed_mentions=discord.AllowedMentions.none())
+                        await ctx.send(error_msg, delete_after=5, allowed_mentions=self.no_pings)
                     
                     # Log the specific error for debugging
-                    self.logger.error(f"Failed to send DM to {target}: {e}")
+                    logger.error(f"Failed to send DM to {target}: {e}")
                 
                 # Log the action
-                self.logger.info(
+                logger.info(
                     "DM sent to %s by %s in %s: %s",
                     target,
                     ctx.author,
@@ -1530,7 +1615,7 @@ class AdminCog(commands.Cog):
                         f"❌ Could not send DM to **{target.display_name}**. "
                         "They may have DMs disabled or blocked the bot.",
                         delete_after=3,
-                        allowed_mentions=discord.AllowedMentions.none()
+                        allowed_mentions=self.no_pings
                     )
             
         except discord.HTTPException as e:
@@ -1545,9 +1630,9 @@ class AdminCog(commands.Cog):
                     await ctx.send(
                         f"❌ Failed to send DM to **{target.display_name}**: {e}",
                         delete_after=3,
-                        allowed_mentions=discord.AllowedMentions.none()
+                        allowed_mentions=self.no_pings
                     )
-                self.logger.error("Failed to send DM to %s: %s", target, e)
+                logger.error("Failed to send DM to %s: %s", target, e)
 
     # =========================================================
     # STATUS COMMAND
@@ -1574,7 +1659,7 @@ class AdminCog(commands.Cog):
             # Create status embed
             embed = discord.Embed(
                 title="🤖 Bot Status",
-                color=discord.Color.green(),
+                color=EMBED_COLOR,
                 timestamp=discord.utils.utcnow()
             )
             
@@ -1612,12 +1697,7 @@ class AdminCog(commands.Cog):
             
             # Auto-delete the command message for prefix commands only
             if not ctx.interaction:
-                try:
-                    await ctx.message.delete()
-                except discord.NotFound:
-                    pass  # Message already deleted
-                except discord.Forbidden:
-                    pass  # No permission to delete
+                self._queue_delete(ctx.message)
             
             # Send message permanently (no auto-delete)
             await ctx.send(embed=embed)
@@ -1628,7 +1708,7 @@ class AdminCog(commands.Cog):
                 await ctx.send(error_msg, ephemeral=True)
             else:
                 await ctx.send(error_msg, delete_after=5)
-            self.logger.error("Failed to get bot status: %s", e)
+            logger.error("Failed to get bot status: %s", e)
 
     # =========================================================
     # BOT ACTIVITY/STATUS COMMANDS
@@ -1646,12 +1726,7 @@ class AdminCog(commands.Cog):
         """
         # Auto-delete the command message for prefix commands
         if not ctx.interaction:
-            try:
-                await ctx.message.delete()
-            except discord.NotFound:
-                pass
-            except discord.Forbidden:
-                pass
+            self._queue_delete(ctx.message)
         
         activity_type = activity_type.lower()
         
@@ -1681,7 +1756,7 @@ class AdminCog(commands.Cog):
             )
             
             # Change the bot's status (preserve current presence status)
-            current_status = self.bot.status if hasattr(self.bot, 'status') else discord.Status.online
+            current_status = self.bot.status
             await self.bot.change_presence(status=current_status, activity=activity)
             
             # Save the new status settings
@@ -1694,7 +1769,7 @@ class AdminCog(commands.Cog):
             else:
                 await ctx.send(success_msg, delete_after=3)
                 
-            self.logger.info("Bot status changed to %s: %s", activity_type, status_text)
+            logger.info("Bot status changed to %s: %s", activity_type, status_text)
             
         except Exception as e:
             error_msg = f"❌ Failed to change status: {e}"
@@ -1702,7 +1777,7 @@ class AdminCog(commands.Cog):
                 await ctx.send(error_msg, ephemeral=True)
             else:
                 await ctx.send(error_msg, delete_after=5)
-            self.logger.error("Failed to change bot status: %s", e)
+            logger.error("Failed to change bot status: %s", e)
 
     @commands.hybrid_command(
         name="resetstatus",
@@ -1713,12 +1788,7 @@ class AdminCog(commands.Cog):
         """Reset the bot's status to the default."""
         # Auto-delete the command message for prefix commands
         if not ctx.interaction:
-            try:
-                await ctx.message.delete()
-            except discord.NotFound:
-                pass
-            except discord.Forbidden:
-                pass
+            self._queue_delete(ctx.message)
         
         try:
             # Create default activity
@@ -1728,7 +1798,7 @@ class AdminCog(commands.Cog):
             )
             
             # Change the bot's status (preserve current presence status)
-            current_status = self.bot.status if hasattr(self.bot, 'status') else discord.Status.online
+            current_status = self.bot.status
             await self.bot.change_presence(status=current_status, activity=activity)
             
             # Save the reset status settings
@@ -1741,7 +1811,7 @@ class AdminCog(commands.Cog):
             else:
                 await ctx.send(success_msg, delete_after=3)
                 
-            self.logger.info("Bot status reset to default")
+            logger.info("Bot status reset to default")
             
         except Exception as e:
             error_msg = f"❌ Failed to reset status: {e}"
@@ -1749,7 +1819,7 @@ class AdminCog(commands.Cog):
                 await ctx.send(error_msg, ephemeral=True)
             else:
                 await ctx.send(error_msg, delete_after=5)
-            self.logger.error("Failed to reset bot status: %s", e)
+            logger.error("Failed to reset bot status: %s", e)
 
     @commands.hybrid_command(
         name="setpresence",
@@ -1763,10 +1833,7 @@ class AdminCog(commands.Cog):
         """
         # Auto-delete the command message for prefix commands
         if not ctx.interaction:
-            try:
-                await ctx.message.delete()
-            except (discord.NotFound, discord.Forbidden):
-                pass
+            self._queue_delete(ctx.message)
         
         presence = presence.lower()
         
@@ -1823,7 +1890,7 @@ class AdminCog(commands.Cog):
             else:
                 await ctx.send(success_msg, delete_after=3)
                 
-            self.logger.info("Bot presence changed to: %s", presence)
+            logger.info("Bot presence changed to: %s", presence)
             
         except Exception as e:
             error_msg = f"❌ Failed to change presence: {e}"
@@ -1834,7 +1901,7 @@ class AdminCog(commands.Cog):
                     await ctx.interaction.followup.send(error_msg, ephemeral=True)
             else:
                 await ctx.send(error_msg, delete_after=5)
-            self.logger.error("Failed to change bot presence: %s", e)
+            logger.error("Failed to change bot presence: %s", e)
 
 
 async def setup(bot):
@@ -4,17 +4,119 @@ Moderation Cog
 Contains all moderation-related slash commands like kick, ban, timeout, etc.
 """
 
+import functools
 import logging
+import os
 import re
 import asyncio
+from collections import OrderedDict, deque
 import discord
 from discord.ext import commands
 from discord import app_commands
-from datetime import timedelta
-from typing import Optional
-from utils.permissions import mod_check
+from datetime import datetime, timedelta
+from typing import Optional, Union
+from utils.permissions import has_mod_permissions, mod_check
+from utils.ratelimit import RouteGate, SlidingWindow, retry
 
-from utils.permissions import has_moderation_permissions, has_higher_role
+logger = logging.getLogger(__name__)
+
+# Error replies shared by several commands
+_ERR_GUILD_ONLY = "❌ This command can only be used in a server."
+_ERR_MUST_BE_MEMBER = "❌ You must be a member of this server to use this command."
+_ERR_NEED_MANAGE_MESSAGES = "❌ You need **Manage Messages**."
+_ERR_NO_DELETE_PERMS = "❌ I don't have permission to delete messages."
+_ERR_BAD_AMOUNT = "❌ Amount must be between 1 and 100."
+_ERR_USER_NOT_FOUND = "❌ User not found."
+
+
+def _http_error(what: str, error: discord.HTTPException) -> str:
+    """Reply text for a failed REST call; a 429 that outlived the retries gets a plain retry hint."""
+    if error.status == 429:
+        return "⏳ Discord is rate limiting this right now, try again in a moment."
+    return f"❌ {what}: {error}"
+
+
+def _audit(action: str, actor, reason: str) -> str:
+    """Build an audit-log reason, cut to fit Discord's 512 byte limit."""
+    return _audit_text(action, str(actor), reason)
+
+
+@functools.lru_cache(maxsize=256)
+def _audit_text(action: str, actor: str, reason: str) -> str:
+    # Most calls repeat ("Kicked", "staff", "No reason provided"), so the
+    # formatted and truncated string is memoized on plain str keys
+    text = f"{action} by {actor}: {reason}"
+    return text.encode("utf-8")[:500].decode("utf-8", "ignore")
+
+
+def _env_rate(name: str, default: int) -> int:
+    """Read a positive per-minute limit from the environment, falling back to default."""
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r, using %d", name, raw, default)
+        return default
+
+
+# Mod actions allowed per minute, per moderator and per guild
+_USER_ACTIONS_PER_MIN = _env_rate("MOD_RATE_PER_USER", 10)
+_GUILD_ACTIONS_PER_MIN = _env_rate("MOD_RATE_PER_GUILD", 30)
+
+
+def _action_keys(guild_id: Optional[int], user_id: int):
+    """(window key, per-minute limit) pairs a mod action counts against."""
+    return (
+        ((guild_id, user_id), _USER_ACTIONS_PER_MIN),
+        (guild_id, _GUILD_ACTIONS_PER_MIN),
+    )
+
+
+def _action_over_budget(window: SlidingWindow, guild_id: Optional[int], user_id: int) -> tuple[int, float]:
+    """Return (limit, retry_after) for the first exhausted budget, or (0, 0.0)."""
+    for key, limit in _action_keys(guild_id, user_id):
+        retry_after = window.retry_after(key, limit, 60.0)
+        if retry_after:
+            return limit, retry_after
+    return 0, 0.0
+
+
+def _record_action(window: SlidingWindow, guild_id: Optional[int], user_id: int) -> None:
+    """Count one mod action; called only once the command passed its checks and is about to act."""
+    for key, _ in _action_keys(guild_id, user_id):
+        window.record(key, 60.0)
+
+
+async def _action_rate_limit(interaction: discord.Interaction) -> bool:
+    """app_commands check: refuse a mod action once the moderator or guild is over its per-minute budget."""
+    window = interaction.command.binding._action_window
+    limit, retry_after = _action_over_budget(window, interaction.guild_id, interaction.user.id)
+    if retry_after:
+        # Reuses the cooldown reply in cog_app_command_error
+        raise app_commands.CommandOnCooldown(app_commands.Cooldown(limit, 60.0), retry_after)
+    return True
+
+
+async def _prefix_action_rate_limit(ctx: commands.Context) -> bool:
+    """commands check: the same per-minute budget for the prefix mod commands."""
+    limit, retry_after = _action_over_budget(ctx.cog._action_window, ctx.guild.id if ctx.guild else None, ctx.author.id)
+    if retry_after:
+        raise commands.CommandOnCooldown(commands.Cooldown(limit, 60.0), retry_after, commands.BucketType.member)
+    return True
+
+
+def _mod_guard(action: str, need_hierarchy: bool = True):
+    """Run ModerationCog._guard on the command's member before the command body."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, interaction: discord.Interaction, member: discord.Member, *args, **kwargs):
+            if not await self._guard(interaction, member, action, need_hierarchy):
+                return
+            return await func(self, interaction, member, *args, **kwargs)
+        return wrapper
+    return decorator
 
 
 class ModerationCog(commands.Cog):
@@ -22,29 +124,255 @@ class ModerationCog(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.logger = logging.getLogger(__name__)
+        # guild id -> icon URL (None if the guild has no icon)
+        self._guild_icon_cache: dict[int, Optional[str]] = {}
+        # (guild id, title, color) -> prebuilt DM embed, copied per use
+        self._dm_templates: dict[tuple[int, str, int], discord.Embed] = {}
+        # (user, embed, future) DMs waiting for the paced sender below
+        self._dm_queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+        self._dm_workers: list[asyncio.Task] = []
+        # Start times of the most recent DM sends, shared by all DM workers
+        self._dm_sent: deque = deque(maxlen=self._DM_RATE[0])
+        # user id -> loop time until which DMs to them are skipped (they refused one)
+        self._dm_closed: dict[int, float] = {}
+        # channel id -> (tokens, last refill) for public confirmations
+        self._channel_buckets: dict[int, tuple[float, float]] = {}
+        # Shared gate for the kick/ban/timeout/unban REST calls
+        self._rest_gate = RouteGate()
+        # user id -> (loop time it expires, fetched User), for users the bot shares no guild with
+        self._user_cache: OrderedDict[int, tuple[float, discord.User]] = OrderedDict()
+        # Per-minute mod action budget, see _action_rate_limit
+        self._action_window = SlidingWindow()
+        # Fire-and-forget tasks; the loop only holds tasks weakly, so keep them alive here
+        self._bg_tasks: set[asyncio.Task] = set()
+
+    async def cog_load(self):
+        self._dm_workers = [asyncio.create_task(self._dm_worker()) for _ in range(self._DM_WORKERS)]
+
+    async def cog_unload(self):
+        for task in self._dm_workers:
+            task.cancel()
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run coro in the background, keeping a reference and logging any failure."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_done)
+        return task
+
+    def _bg_done(self, task: asyncio.Task) -> None:
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background task failed", exc_info=task.exception())
 
     async def delete_command_message(self, ctx):
-        """Helper to delete the command message."""
+        """Helper to delete the command message (purges await it so it isn't swept into the count)."""
+        # Skip the request entirely when Discord would just answer 403
+        if not ctx.guild or not ctx.channel.permissions_for(ctx.guild.me).manage_messages:
+            return
         try:
             await ctx.message.delete()
         except (discord.NotFound, discord.Forbidden):
             pass
 
+    async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        """Tell the moderator when a slash command hit its cooldown; log anything else."""
+        if isinstance(error, app_commands.CommandOnCooldown):
+            msg = f"⏳ Slow down, retry in {error.retry_after:.1f}s."
+        else:
+            # Having this handler stops the tree from logging the error itself
+            command = interaction.command.qualified_name if interaction.command else None
+            logger.error("Slash command %s failed", command, exc_info=error)
+            msg = "❌ Something went wrong while running this command."
+        try:
+            if interaction.response.is_done():
+                await interaction.followup.send(msg, ephemeral=True)
+            else:
+                await interaction.response.send_message(msg, ephemeral=True)
+        except discord.HTTPException:
+            pass
+
+    # Discord permission each guarded action needs, as Permissions.value bits
+    _ACTION_PERMS = {
+        "kick": discord.Permissions(kick_members=True).value,
+        "ban": discord.Permissions(ban_members=True).value,
+        "timeout": discord.Permissions(moderate_members=True).value,
+        "remove timeout from": discord.Permissions(moderate_members=True).value,
+    }
+
+    async def _guard(self, src: Union[discord.Interaction, commands.Context], member: discord.Member, action: str, need_hierarchy: bool = True) -> bool:
+        """Run the shared guild/permission/hierarchy checks; reply and return False if any fail."""
+        is_interaction = isinstance(src, discord.Interaction)
+        guild = src.guild
+        user = src.user if is_interaction else src.author
+        if not guild:
+            msg = _ERR_GUILD_ONLY
+        elif not isinstance(user, discord.Member):
+            msg = _ERR_MUST_BE_MEMBER
+        elif member.id in (guild.owner_id, guild.me.id):
+            # Discord always rejects actions on the owner or the bot itself
+            msg = "❌ Cannot target that member."
+        elif user.id != guild.owner_id and not (
+            # Admins get every bit in guild_permissions, so one AND covers them too
+            user.guild_permissions.value & self._ACTION_PERMS[action]
+            and user.top_role > member.top_role
+        ):
+            msg = f"❌ You don't have permission to {action} this member."
+        elif need_hierarchy and not guild.me.top_role > member.top_role:
+            msg = f"❌ I cannot {action} this member due to role hierarchy."
+        else:
+            return True
+        if is_interaction:
+            await src.response.send_message(msg, ephemeral=True)
+        else:
+            await src.send(msg, delete_after=5)
+        return False
+
     # ---------- tiny builder for compact Dyno-like embeds ----------
-    def _dyno_style_embed(self, verb_past: str, target: discord.abc.User, reason: str) -> discord.Embed:
+    # Embed colors, resolved once instead of a discord.Color call per embed
+    _C_GREEN = discord.Color.green().value
+    _C_RED = discord.Color.red().value
+
+    # Fixed parts of the embeds; only the per-call fields are merged in
+    _DYNO_TEMPLATE = {"type": "rich", "color": _C_GREEN}
+    _DM_TEMPLATE = {"type": "rich"}
+    # Upper bound on cached (guild, title, color) DM templates
+    _DM_TEMPLATE_MAX = 512
+
+    def _dyno_style_embed(self, verb_past: str, target: discord.abc.Snowflake, reason: str, now: Optional[datetime] = None, extra: str = "") -> discord.Embed:
         """
         Build a compact embed:
         - color: green
-        - description: "**name** was <verb>.\n***Reason:*** <reason>"
-        - footer will be added by caller (User ID only)
+        - description: "**name** was <verb>.\n***Reason:*** <reason>" followed by any extra lines
+        - footer: "User ID: <id>"
         """
-        display = getattr(target, "display_name", getattr(target, "name", "User"))
-        return discord.Embed(
-            description=f"**{display}** was {verb_past}.\n***Reason:*** {reason}",
-            color=discord.Color.green(),
-            timestamp=discord.utils.utcnow()
-        )
+        # Members and Users both carry display_name; a bare discord.Object gets a mention
+        display = getattr(target, "display_name", None) or f"<@{target.id}>"
+        embed = discord.Embed.from_dict({
+            **self._DYNO_TEMPLATE,
+            "description": f"**{display}** was {verb_past}.\n***Reason:*** {reason}{extra}",
+            "footer": {"text": f"User ID: {target.id}"},
+        })
+        embed.timestamp = now or discord.utils.utcnow()
+        return embed
+
+    def _dm_embed(self, guild: discord.Guild, title: str, description: str, color: int = _C_GREEN, now: Optional[datetime] = None) -> discord.Embed:
+        """Build the best-effort DM embed sent to a moderated user."""
+        key = (guild.id, title, color)
+        template = self._dm_templates.get(key)
+        if template is None:
+            if len(self._dm_templates) >= self._DM_TEMPLATE_MAX:
+                # Evict the oldest entry; dicts keep insertion order
+                del self._dm_templates[next(iter(self._dm_templates))]
+            data = {**self._DM_TEMPLATE, "title": title, "color": color}
+            icon_url = self._guild_icon_url(guild)
+            if icon_url:
+                data["thumbnail"] = {"url": icon_url}
+            template = self._dm_templates[key] = discord.Embed.from_dict(data)
+        embed = template.copy()
+        embed.description = description
+        embed.timestamp = now or discord.utils.utcnow()
+        return embed
+
+    def _forget_guild(self, guild_id: int) -> None:
+        """Drop the cached icon and DM templates for a guild."""
+        self._guild_icon_cache.pop(guild_id, None)
+        for key in [k for k in self._dm_templates if k[0] == guild_id]:
+            del self._dm_templates[key]
+
+    # Upper bound on how long a removal waits for its notice DM to land
+    _DM_HEAD_START = 1.5
+    # Discord allows roughly 5 DM sends per 5 seconds per bot
+    _DM_RATE = (5, 5.0)
+    # A DM stuck longer than this is given up on so it can't stall the queue
+    _DM_SEND_TIMEOUT = 2.0
+    # Workers draining the DM queue; a slow or refused DM only ties up one of them
+    _DM_WORKERS = 4
+    # How long a user who refused a DM (403) is skipped
+    _DM_CLOSED_TTL = 600.0
+    # Discord's "Cannot send messages to this user" error code
+    _DM_CLOSED_CODE = 50007
+
+    def _queue_dm(self, user: discord.abc.User, embed: discord.Embed) -> asyncio.Future:
+        """Hand a DM to the paced sender; the future resolves with the sent message or the error."""
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        closed_until = self._dm_closed.get(user.id)
+        if closed_until is not None:
+            if closed_until > loop.time():
+                fut.set_exception(discord.ClientException("user recently refused a DM"))
+                return fut
+            del self._dm_closed[user.id]
+        try:
+            self._dm_queue.put_nowait((user, embed, fut))
+        except asyncio.QueueFull:
+            fut.set_exception(discord.ClientException("DM queue is full"))
+        return fut
+
+    async def _dm_worker(self):
+        """Send queued DMs; all workers together stay under _DM_RATE[0] per _DM_RATE[1] seconds."""
+        limit, per = self._DM_RATE
+        sent = self._dm_sent
+        loop = asyncio.get_running_loop()
+        while True:
+            user, embed, fut = await self._dm_queue.get()
+            start = loop.time()
+            if len(sent) == limit:
+                start = max(start, sent[0] + per)
+            # Reserve the slot before sleeping so workers don't race for it
+            sent.append(start)
+            if start > loop.time():
+                await asyncio.sleep(start - loop.time())
+            try:
+                msg = await asyncio.wait_for(user.send(embed=embed), timeout=self._DM_SEND_TIMEOUT)
+            except discord.Forbidden as err:
+                # Only remember users who closed their DMs. A 403 for a member who was
+                # just kicked/banned means "no shared guild" and says nothing about
+                # their DM settings, so it must not block e.g. the unban DM.
+                if err.code == self._DM_CLOSED_CODE and self._still_member(user):
+                    now = loop.time()
+                    if len(self._dm_closed) >= 1024:
+                        self._dm_closed = {uid: t for uid, t in self._dm_closed.items() if t > now}
+                    self._dm_closed[user.id] = now + self._DM_CLOSED_TTL
+                if not fut.done():
+                    fut.set_exception(err)
+            except Exception as err:
+                if not fut.done():
+                    fut.set_exception(err)
+            else:
+                if not fut.done():
+                    fut.set_result(msg)
+
+    @staticmethod
+    def _still_member(user: discord.abc.User) -> bool:
+        """True if user is a Member whose guild still lists them, i.e. the bot shares a guild with them."""
+        return isinstance(user, discord.Member) and user.guild.get_member(user.id) is not None
+
+    async def _dm_head_start(self, user: discord.abc.User, embed: discord.Embed) -> None:
+        """Start a best-effort DM and wait at most _DM_HEAD_START for it before the action runs."""
+        def _log_failure(fut: asyncio.Future) -> None:
+            if not fut.cancelled() and fut.exception() is not None:
+                logger.debug("Could not DM %s (%s): %s", user, user.id, fut.exception())
+
+        dm = self._queue_dm(user, embed)
+        dm.add_done_callback(_log_failure)
+        await asyncio.wait({dm}, timeout=self._DM_HEAD_START)
+
+    def _guild_icon_url(self, guild: discord.Guild) -> Optional[str]:
+        """Return the guild's icon URL, resolving the Asset only once per guild."""
+        try:
+            return self._guild_icon_cache[guild.id]
+        except KeyError:
+            url = self._guild_icon_cache[guild.id] = guild.icon.url if guild.icon else None
+            return url
+
+    @commands.Cog.listener()
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild):
+        self._forget_guild(after.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self._forget_guild(guild.id)
 
     # ---------- regex helpers ----------
     def _invite_regex(self):
@@ -58,6 +386,233 @@ class ModerationCog(commands.Cog):
             re.IGNORECASE
         )
 
+    # ---------- shared action bodies (slash + prefix) ----------
+    # Discord allows 5 messages per 5 seconds in a channel
+    _CHANNEL_BURST = 5
+    _CHANNEL_REFILL = 1.0  # tokens per second
+
+    async def _throttle_channel(self, channel_id: int):
+        """Wait until channel_id has a send token; callers queue up behind each other."""
+        now = asyncio.get_running_loop().time()
+        tokens, last = self._channel_buckets.get(channel_id, (self._CHANNEL_BURST, now))
+        tokens = min(self._CHANNEL_BURST, tokens + (now - last) * self._CHANNEL_REFILL) - 1
+        # Take the token before sleeping so concurrent senders line up instead of racing
+        self._channel_buckets[channel_id] = (tokens, now)
+        if tokens < 0:
+            await asyncio.sleep(-tokens / self._CHANNEL_REFILL)
+
+    async def _gated(self, route: str, coro_factory):
+        """Run a REST call through the cog's RouteGate, retrying transient failures."""
+        async def attempt():
+            # Each attempt passes the gate, so every 429 shrinks the limiter window
+            async with self._rest_gate(route):
+                return await coro_factory()
+        return await retry(attempt)
+
+    _USER_CACHE_MAX = 1024
+    # Fetched users are reused for this long, so renames show up eventually
+    _USER_CACHE_TTL = 300.0
+
+    def _cached_user(self, user_id: int) -> Optional[discord.User]:
+        """Return a still-fresh fetched User from our LRU, or None."""
+        entry = self._user_cache.get(user_id)
+        if entry is None:
+            return None
+        expires, user = entry
+        if expires <= asyncio.get_running_loop().time():
+            del self._user_cache[user_id]
+            return None
+        self._user_cache.move_to_end(user_id)
+        return user
+
+    async def _resolve_user(self, user_id: int) -> discord.User:
+        """Return a User by id, fetching it only if neither the client nor our LRU has it."""
+        user = self.bot.get_user(user_id) or self._cached_user(user_id)
+        if user is not None:
+            return user
+        user = await retry(lambda: self.bot.fetch_user(user_id))
+        expires = asyncio.get_running_loop().time() + self._USER_CACHE_TTL
+        self._user_cache[user_id] = (expires, user)
+        if len(self._user_cache) > self._USER_CACHE_MAX:
+            self._user_cache.popitem(last=False)
+        return user
+
+    async def _reply(self, src: Union[discord.Interaction, commands.Context], content: Optional[str] = None, *, embed: Optional[discord.Embed] = None):
+        """Send a result embed, or an error line that stays out of the channel (ephemeral / auto-deleted)."""
+        if isinstance(src, discord.Interaction):
+            # Followups are webhook sends on the interaction token, outside the channel's message limit
+            if embed is None:
+                return await src.followup.send(content, ephemeral=True)
+            return await src.followup.send(embed=embed)
+        if embed is None:
+            return await src.send(content, delete_after=5)
+        await self._throttle_channel(src.channel.id)
+        return await src.send(embed=embed)
+
+    async def _not_banned(self, src: Union[discord.Interaction, commands.Context], user: discord.abc.User) -> bool:
+        """Return True if user can be banned; otherwise reply with the reason."""
+        try:
+            await self._gated("guild_ban", lambda: src.guild.fetch_ban(user))
+            await self._reply(src, f"❌ {user.mention} is already banned.")
+            return False
+        except discord.NotFound:
+            return True
+        except discord.Forbidden:
+            await self._reply(src, "❌ I don't have permission to check bans.")
+            return False
+
+    def _count_action(self, src: Union[discord.Interaction, commands.Context]) -> None:
+        """Charge the moderator and guild one action, once every check has passed."""
+        actor = src.user if isinstance(src, discord.Interaction) else src.author
+        _record_action(self._action_window, src.guild.id, actor.id)
+
+    async def _do_kick(self, src: Union[discord.Interaction, commands.Context], member: discord.Member, reason: str):
+        self._count_action(src)
+        now = discord.utils.utcnow()
+
+        # DM best-effort
+        dm = self._dm_embed(
+            src.guild,
+            f"You were kicked from {src.guild.name}",
+            f"***Reason:*** {reason}",
+            now=now
+        )
+        await self._dm_head_start(member, dm)
+
+        try:
+            await self._gated("guild_kick", lambda: member.kick(reason=_audit("Kicked", "staff", reason)))
+            await self._reply(src, embed=self._dyno_style_embed("kicked", member, reason, now=now))
+        except discord.Forbidden:
+            await self._reply(src, "❌ I don't have permission to kick this member.")
+        except discord.HTTPException as e:
+            await self._reply(src, _http_error("Failed to kick member", e))
+
+    async def _do_ban(self, src: Union[discord.Interaction, commands.Context], user: discord.abc.User, member: Optional[discord.Member], reason: str, delete_messages: Optional[int]):
+        """Ban user; delete_messages=None leaves discord.py's default message purge."""
+        if not await self._not_banned(src, user):
+            return
+        self._count_action(src)
+
+        now = discord.utils.utcnow()
+
+        # Try to DM the user (best effort)
+        if member:  # Only try to DM if they're in the server
+            dm = self._dm_embed(
+                src.guild,
+                f"You were banned from {src.guild.name}",
+                f"***Reason:*** {reason}",
+                color=self._C_RED,
+                now=now
+            )
+            await self._dm_head_start(user, dm)
+
+        actor = src.user if isinstance(src, discord.Interaction) else src.author
+        kwargs = {} if delete_messages is None else {"delete_message_days": delete_messages}
+        try:
+            await self._gated("guild_ban", lambda: src.guild.ban(user, reason=_audit("Banned", actor, reason), **kwargs))
+
+            # Create success embed
+            extra = f"\n***Messages Deleted:*** {delete_messages} day(s)" if delete_messages else ""
+            await self._reply(src, embed=self._dyno_style_embed("banned", user, reason, now=now, extra=extra))
+        except discord.Forbidden:
+            await self._reply(src, "❌ I don't have permission to ban this user.")
+        except discord.HTTPException as e:
+            await self._reply(src, _http_error("Failed to ban user", e))
+
+    async def _do_tempban(self, src: Union[discord.Interaction, commands.Context], user: discord.abc.User, member: Optional[discord.Member], reason: str, duration: str, ban_duration: timedelta, delete_messages: int):
+        if not await self._not_banned(src, user):
+            return
+        self._count_action(src)
+
+        now = discord.utils.utcnow()
+        # Unix time of the automatic unban, for the <t:...> markers below
+        unban_ts = int((now + ban_duration).timestamp())
+
+        # Try to DM the user (best effort)
+        if member:  # Only try to DM if they're in the server
+            dm = self._dm_embed(
+                src.guild,
+                f"You were temporarily banned from {src.guild.name}",
+                f"***Reason:*** {reason}\n***Duration:*** {duration}\n***Unban Time:*** <t:{unban_ts}:F>",
+                color=self._C_RED,
+                now=now
+            )
+            await self._dm_head_start(user, dm)
+
+        actor = src.user if isinstance(src, discord.Interaction) else src.author
+        try:
+            await self._gated("guild_ban", lambda: src.guild.ban(user, reason=_audit("Tempban", actor, f"{reason} (Duration: {duration})"), delete_message_days=delete_messages))
+
+            # Schedule unban
+            self.bot.loop.create_task(self._schedule_unban(src.guild, user, ban_duration))
+
+            # Create success embed
+            extra = f"\n***Duration:*** {duration}\n***Unban Time:*** <t:{unban_ts}:R>"
+            if delete_messages:
+                extra += f"\n***Messages Deleted:*** {delete_messages} day(s)"
+            await self._reply(src, embed=self._dyno_style_embed("temporarily banned", user, reason, now=now, extra=extra))
+        except discord.Forbidden:
+            await self._reply(src, "❌ I don't have permission to ban this user.")
+        except discord.HTTPException as e:
+            await self._reply(src, _http_error("Failed to ban user", e))
+
+    async def _do_timeout(self, src: Union[discord.Interaction, commands.Context], member: discord.Member, duration: str, timeout_duration: timedelta, reason: str):
+        self._count_action(src)
+        now = discord.utils.utcnow()
+        until = now + timeout_duration
+        until_fmt = discord.utils.format_dt(until, style='F')
+
+        dm = self._dm_embed(
+            src.guild,
+            f"You were timed out in {src.guild.name}",
+            (
+                f"***Duration:*** {duration}\n"
+                f"***Until:*** {until_fmt}\n"
+                f"***Reason:*** {reason}"
+            ),
+            now=now
+        )
+        # DM best-effort; the member stays in the guild, so the DM and the
+        # timeout can go out together instead of one after the other
+        _, result = await asyncio.gather(
+            self._dm_head_start(member, dm),
+            self._gated("member_edit", lambda: member.timeout(until, reason=_audit("Timed out", "staff", reason))),
+            return_exceptions=True
+        )
+        if isinstance(result, discord.Forbidden):
+            return await self._reply(src, "❌ I don't have permission to timeout this member.")
+        if isinstance(result, discord.HTTPException):
+            return await self._reply(src, _http_error("Failed to timeout member", result))
+        if isinstance(result, BaseException):
+            raise result
+
+        extra = f"\n***Until:*** {until_fmt} • ***Duration:*** {duration}"
+        await self._reply(src, embed=self._dyno_style_embed("timed out", member, reason, now=now, extra=extra))
+
+    async def _do_untimeout(self, src: Union[discord.Interaction, commands.Context], member: discord.Member, reason: str):
+        self._count_action(src)
+        now = discord.utils.utcnow()
+        dm = self._dm_embed(
+            src.guild,
+            f"Your timeout was removed in {src.guild.name}",
+            f"***Reason:*** {reason}",
+            now=now
+        )
+        # DM best-effort, sent alongside the timeout removal
+        _, result = await asyncio.gather(
+            self._dm_head_start(member, dm),
+            self._gated("member_edit", lambda: member.timeout(None, reason=_audit("Timeout removed", "staff", reason))),
+            return_exceptions=True
+        )
+        if isinstance(result, discord.Forbidden):
+            return await self._reply(src, "❌ I don't have permission to remove timeout from this member.")
+        if isinstance(result, discord.HTTPException):
+            return await self._reply(src, _http_error("Failed to remove timeout", result))
+        if isinstance(result, BaseException):
+            raise result
+
+        await self._reply(src, embed=self._dyno_style_embed("untimed out", member, reason, now=now))
+
     # ==============================
     # Slash commands
     # ==============================
@@ -65,37 +620,14 @@ class ModerationCog(commands.Cog):
     # Kick
     @app_commands.command(name="kick", description="Kick a member from the server")
     @app_commands.describe(member="The member to kick", reason="Reason for the kick")
+    @app_commands.checks.cooldown(5, 10.0, key=lambda i: i.guild_id)
+    @app_commands.check(_action_rate_limit)
+    @_mod_guard("kick")
     async def kick(self, interaction: discord.Interaction, member: discord.Member, reason: Optional[str] = "No reason provided"):
-        if not interaction.guild:
-            return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
-        if not isinstance(interaction.user, discord.Member):
-            return await interaction.response.send_message("❌ You must be a member of this server to use this command.", ephemeral=True)
-        if not has_moderation_permissions(interaction.user, member):
-            return await interaction.response.send_message("❌ You don't have permission to kick this member.", ephemeral=True)
-        if not has_higher_role(interaction.guild.me, member):
-            return await interaction.response.send_message("❌ I cannot kick this member due to role hierarchy.", ephemeral=True)
+        # Acknowledge now; the DM and moderation calls below can outlast the 3s window
+        await interaction.response.defer()
 
-        # DM best-effort
-        try:
-            dm = discord.Embed(
-                title=f"You were kicked from {interaction.guild.name}",
-                description=f"***Reason:*** {reason}",
-                color=discord.Color.green(),
-                timestamp=discord.utils.utcnow()
-            )
-            if interaction.guild.icon:
-                dm.set_thumbnail(url=interaction.guild.icon.url)
-            await member.send(embed=dm)
-        except Exception:
-            pass
-
-        try:
-            await member.kick(reason=f"Kicked by staff: {reason}")
-            e = self._dyno_style_embed("kicked", member, reason)
-            e.set_footer(text=f"User ID: {member.id}")
-            await interaction.response.send_message(embed=e)
-        except discord.Forbidden:
-            await interaction.response.send_message("❌ I don't have permission to kick this member.", ephemeral=True)
+        await self._do_kick(interaction, member, reason)
 
     # Ban
     @app_commands.command(name="ban", description="Ban a member or user from the server")
@@ -104,13 +636,16 @@ class ModerationCog(commands.Cog):
         reason="Reason for the ban",
         delete_messages="Number of days of messages to delete (0-7)"
     )
+    @app_commands.checks.cooldown(5, 10.0, key=lambda i: i.guild_id)
+    @app_commands.check(_action_rate_limit)
     async def ban(self, interaction: discord.Interaction, target: str, reason: Optional[str] = "No reason provided", delete_messages: Optional[int] = 0):
-        if delete_messages is not None and (delete_messages < 0 or delete_messages > 7):
+        delete_messages = delete_messages or 0
+        if not 0 <= delete_messages <= 7:
             return await interaction.response.send_message("❌ Delete messages must be between 0 and 7 days.", ephemeral=True)
         if not interaction.guild:
-            return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
+            return await interaction.response.send_message(_ERR_GUILD_ONLY, ephemeral=True)
         if not isinstance(interaction.user, discord.Member):
-            return await interaction.response.send_message("❌ You must be a member of this server to use this command.", ephemeral=True)
+            return await interaction.response.send_message(_ERR_MUST_BE_MEMBER, ephemeral=True)
         
         # Try to resolve the target (member, user ID, or fetch user)
         member = None
@@ -139,10 +674,8 @@ class ModerationCog(commands.Cog):
         
         # If we found a member, do permission checks
         if member:
-            if not has_moderation_permissions(interaction.user, member):
-                return await interaction.response.send_message("❌ You don't have permission to ban this member.", ephemeral=True)
-            if not has_higher_role(interaction.guild.me, member):
-                return await interaction.response.send_message("❌ I cannot ban this member due to role hierarchy.", ephemeral=True)
+            if not await self._guard(interaction, member, "ban"):
+                return
             user = member
         else:
             # User not in server, try to fetch user object
@@ -153,51 +686,20 @@ class ModerationCog(commands.Cog):
             if not interaction.user.guild_permissions.ban_members:
                 return await interaction.response.send_message("❌ You need ban permissions to ban users not in the server.", ephemeral=True)
             
+            # Acknowledge first; fetching the user retries and can outlast the 3s window
+            await interaction.response.defer()
             try:
-                user = await self.bot.fetch_user(user_id)
+                user = await self._resolve_user(user_id)
             except discord.NotFound:
-                return await interaction.response.send_message("❌ User not found.", ephemeral=True)
+                return await interaction.followup.send(_ERR_USER_NOT_FOUND, ephemeral=True)
             except discord.HTTPException:
-                return await interaction.response.send_message("❌ Failed to fetch user information.", ephemeral=True)
+                return await interaction.followup.send("❌ Failed to fetch user information.", ephemeral=True)
 
-        # Check if user is already banned
-        try:
-            ban_entry = await interaction.guild.fetch_ban(user)
-            return await interaction.response.send_message(f"❌ {user.mention} is already banned.", ephemeral=True)
-        except discord.NotFound:
-            pass  # User is not banned, continue
-        except discord.Forbidden:
-            return await interaction.response.send_message("❌ I don't have permission to check bans.", ephemeral=True)
+        # Acknowledge now; the DM and moderation calls below can outlast the 3s window
+        if not interaction.response.is_done():
+            await interaction.response.defer()
 
-        # Try to DM the user (best effort)
-        if member:  # Only try to DM if they're in the server
-            try:
-                dm = discord.Embed(
-                    title=f"You were banned from {interaction.guild.name}",
-                    description=f"***Reason:*** {reason}",
-                    color=discord.Color.red(),
-                    timestamp=discord.utils.utcnow()
-                )
-                if interaction.guild.icon:
-                    dm.set_thumbnail(url=interaction.guild.icon.url)
-                await user.send(embed=dm)
-            except Exception:
-                pass
-
-        try:
-            await interaction.guild.ban(user, reason=f"Banned by {interaction.user}: {reason}", delete_message_days=delete_messages or 0)
-            
-            # Create success embed
-            e = self._dyno_style_embed("banned", user, reason)
-            if delete_messages:
-                e.description += f"\n***Messages Deleted:*** {delete_messages} day(s)"
-            e.set_footer(text=f"User ID: {user.id}")
-            await interaction.response.send_message(embed=e)
-            
-        except discord.Forbidden:
-            await interaction.response.send_message("❌ I don't have permission to ban this user.", ephemeral=True)
-        except discord.HTTPException as e:
-            await interaction.response.send_message(f"❌ Failed to ban user: {e}", ephemeral=True)
+        await self._do_ban(interaction, user, member, reason, delete_messages)
 
     # Tempban
     @app_commands.command(name="tempban", description="Temporarily ban a member or user from the server")
@@ -207,13 +709,16 @@ class ModerationCog(commands.Cog):
         reason="Reason for the temporary ban",
         delete_messages="Number of days of messages to delete (0-7)"
     )
+    @app_commands.checks.cooldown(5, 10.0, key=lambda i: i.guild_id)
+    @app_commands.check(_action_rate_limit)
     async def tempban(self, interaction: discord.Interaction, target: str, duration: str, reason: Optional[str] = "No reason provided", delete_messages: Optional[int] = 0):
-        if delete_messages is not None and (delete_messages < 0 or delete_messages > 7):
+        delete_messages = delete_messages or 0
+        if not 0 <= delete_messages <= 7:
             return await interaction.response.send_message("❌ Delete messages must be between 0 and 7 days.", ephemeral=True)
         if not interaction.guild:
-            return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
+            return await interaction.response.send_message(_ERR_GUILD_ONLY, ephemeral=True)
         if not isinstance(interaction.user, discord.Member):
-            return await interaction.response.send_message("❌ You must be a member of this server to use this command.", ephemeral=True)
+            return await interaction.response.send_message(_ERR_MUST_BE_MEMBER, ephemeral=True)
         
         # Parse duration
         ban_duration = self._parse_duration(duration)
@@ -247,10 +752,8 @@ class ModerationCog(commands.Cog):
         
         # If we found a member, do permission checks
         if member:
-            if not has_moderation_permissions(interaction.user, member):
-                return await interaction.response.send_message("❌ You don't have permission to ban this member.", ephemeral=True)
-            if not has_higher_role(interaction.guild.me, member):
-                return await interaction.response.send_message("❌ I cannot ban this member due to role hierarchy.", ephemeral=True)
+            if not await self._guard(interaction, member, "ban"):
+                return
             user = member
         else:
             # User not in server, try to fetch user object
@@ -261,62 +764,23 @@ class ModerationCog(commands.Cog):
             if not interaction.user.guild_permissions.ban_members:
                 return await interaction.response.send_message("❌ You need ban permissions to ban users not in the server.", ephemeral=True)
             
+            # Acknowledge first; fetching the user retries and can outlast the 3s window
+            await interaction.response.defer()
             try:
-                user = await self.bot.fetch_user(user_id)
+                user = await self._resolve_user(user_id)
             except discord.NotFound:
-                return await interaction.response.send_message("❌ User not found.", ephemeral=True)
+                return await interaction.followup.send(_ERR_USER_NOT_FOUND, ephemeral=True)
             except discord.HTTPException:
-                return await interaction.response.send_message("❌ Failed to fetch user information.", ephemeral=True)
-
-        # Check if user is already banned
-        try:
-            ban_entry = await interaction.guild.fetch_ban(user)
-            return await interaction.response.send_message(f"❌ {user.mention} is already banned.", ephemeral=True)
-        except discord.NotFound:
-            pass  # User is not banned, continue
-        except discord.Forbidden:
-            return await interaction.response.send_message("❌ I don't have permission to check bans.", ephemeral=True)
+                return await interaction.followup.send("❌ Failed to fetch user information.", ephemeral=True)
 
-        # Try to DM the user (best effort)
-        if member:  # Only try to DM if they're in the server
-            try:
-                unban_time = discord.utils.utcnow() + ban_duration
-                dm = discord.Embed(
-                    title=f"You were temporarily banned from {interaction.guild.name}",
-                    description=f"***Reason:*** {reason}\n***Duration:*** {duration}\n***Unban Time:*** <t:{int(unban_time.timestamp())}:F>",
-                    color=discord.Color.red(),
-                    timestamp=discord.utils.utcnow()
-                )
-                if interaction.guild.icon:
-                    dm.set_thumbnail(url=interaction.guild.icon.url)
-                await user.send(embed=dm)
-            except Exception:
-                pass
+        # Acknowledge now; the DM and moderation calls below can outlast the 3s window
+        if not interaction.response.is_done():
+            await interaction.response.defer()
 
-        try:
-            await interaction.guild.ban(user, reason=f"Tempban by {interaction.user}: {reason} (Duration: {duration})", delete_message_days=delete_messages or 0)
-            
-            # Schedule unban
-            unban_time = discord.utils.utcnow() + ban_duration
-            self.bot.loop.create_task(self._schedule_unban(interaction.guild, user, ban_duration))
-            
-            # Create success embed
-            e = self._dyno_style_embed("temporarily banned", user, reason)
-            e.description += f"\n***Duration:*** {duration}\n***Unban Time:*** <t:{int(unban_time.timestamp())}:R>"
-            if delete_messages:
-                e.description += f"\n***Messages Deleted:*** {delete_messages} day(s)"
-            e.set_footer(text=f"User ID: {user.id}")
-            await interaction.response.send_message(embed=e)
-            
-        except discord.Forbidden:
-            await interaction.response.send_message("❌ I don't have permission to ban this user.", ephemeral=True)
-        except discord.HTTPException as e:
-            await interaction.response.send_message(f"❌ Failed to ban user: {e}", ephemeral=True)
+        await self._do_tempban(interaction, user, member, reason, duration, ban_duration, delete_messages)
 
     def _parse_duration(self, duration_str: str) -> Optional[timedelta]:
         """Parse duration string like '1h', '30m', '1d', '2w' into timedelta."""
-        import re
-        
         # Match number followed by unit
         match = re.match(r'^(\d+)([smhdw])$', duration_str.lower())
         if not match:
@@ -338,57 +802,51 @@ class ModerationCog(commands.Cog):
         
         return None
     
+    async def _send_unban_dm(self, user: discord.User, embed: discord.Embed, kind: str):
+        """Best-effort unban notice; failures are only logged."""
+        try:
+            await self._queue_dm(user, embed)
+            logger.info("Successfully sent %s DM to %s (%s)", kind, user, user.id)
+        except discord.Forbidden:
+            logger.warning("Failed to send %s DM to %s (%s) - user has DMs disabled or blocked the bot", kind, user, user.id)
+        except discord.HTTPException as e:
+            logger.warning("Failed to send %s DM to %s (%s) - HTTP error: %s", kind, user, user.id, e)
+        except Exception as e:
+            logger.warning("Failed to send %s DM to %s (%s) - unexpected error: %s", kind, user, user.id, e)
+
     async def _schedule_unban(self, guild: discord.Guild, user: discord.User, duration: timedelta):
         """Schedule an unban after the specified duration."""
         await asyncio.sleep(duration.total_seconds())
         
         try:
             # Check if user is still banned
-            await guild.fetch_ban(user)
+            await self._gated("guild_ban", lambda: guild.fetch_ban(user))
             # If we get here, user is still banned, so unban them
-            await guild.unban(user, reason="Temporary ban expired")
+            await self._gated("guild_ban", lambda: guild.unban(user, reason="Temporary ban expired"))
             
             # Try to DM the user about the unban (best effort)
-            try:
-                unban_embed = discord.Embed(
-                    title=f"Your temporary ban from {guild.name} has expired",
-                    description="You have been automatically unbanned and can now rejoin the server.",
-                    color=discord.Color.green(),
-                    timestamp=discord.utils.utcnow()
-                )
-                if guild.icon:
-                    unban_embed.set_thumbnail(url=guild.icon.url)
-                await user.send(embed=unban_embed)
-                self.logger.info(f"Successfully sent auto-unban DM to {user} ({user.id})")
-            except discord.Forbidden:
-                self.logger.warning(f"Failed to send auto-unban DM to {user} ({user.id}) - user has DMs disabled or blocked the bot")
-            except discord.HTTPException as e:
-                self.logger.warning(f"Failed to send auto-unban DM to {user} ({user.id}) - HTTP error: {e}")
-            except Exception as e:
-                self.logger.warning(f"Failed to send auto-unban DM to {user} ({user.id}) - unexpected error: {e}")
+            unban_embed = self._dm_embed(
+                guild,
+                f"Your temporary ban from {guild.name} has expired",
+                "You have been automatically unbanned and can now rejoin the server."
+            )
+            await self._send_unban_dm(user, unban_embed, "auto-unban")
             
-            self.logger.info(f"Automatically unbanned {user} ({user.id}) from {guild.name} - tempban expired")
+            logger.info("Automatically unbanned %s (%s) from %s - tempban expired", user, user.id, guild.name)
         except discord.NotFound:
             # User is not banned anymore
             pass
         except discord.Forbidden:
-            self.logger.error(f"Failed to auto-unban {user} ({user.id}) from {guild.name} - missing permissions")
+            logger.error("Failed to auto-unban %s (%s) from %s - missing permissions", user, user.id, guild.name)
         except Exception as e:
-            self.logger.error(f"Failed to auto-unban {user} ({user.id}) from {guild.name}: {e}")
+            logger.error("Failed to auto-unban %s (%s) from %s: %s", user, user.id, guild.name, e)
 
     # Timeout
     @app_commands.command(name="timeout", description="Timeout a member")
     @app_commands.describe(member="The member to timeout", duration="Duration (e.g., 30m, 1h, 2d)", reason="Reason for the timeout")
+    @app_commands.checks.cooldown(5, 10.0, key=lambda i: i.guild_id)
+    @app_commands.check(_action_rate_limit)
     async def timeout(self, interaction: discord.Interaction, member: discord.Member, duration: str, reason: Optional[str] = "No reason provided"):
-        if not interaction.guild:
-            return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
-        if not isinstance(interaction.user, discord.Member):
-            return await interaction.response.send_message("❌ You must be a member of this server to use this command.", ephemeral=True)
-        if not has_moderation_permissions(interaction.user, member):
-            return await interaction.response.send_message("❌ You don't have permission to timeout this member.", ephemeral=True)
-        if not has_higher_role(interaction.guild.me, member):
-            return await interaction.response.send_message("❌ I cannot timeout this member due to role hierarchy.", ephemeral=True)
-
         # Parse duration
         timeout_duration = self._parse_duration(duration)
         if not timeout_duration:
@@ -398,134 +856,190 @@ class ModerationCog(commands.Cog):
         max_duration = timedelta(days=28)
         if timeout_duration > max_duration:
             return await interaction.response.send_message("❌ Duration cannot exceed 28 days.", ephemeral=True)
-            return await interaction.response.send_message("❌ I cannot timeout this member due to role hierarchy.", ephemeral=True)
 
-        until = discord.utils.utcnow() + timeout_duration
+        # Guard after the cheap input checks, as prefix_timeout does
+        if not await self._guard(interaction, member, "timeout"):
+            return
 
-        # DM best-effort
-        try:
-            dm = discord.Embed(
-                title=f"You were timed out in {interaction.guild.name}",
-                description=(
-                    f"***Duration:*** {duration}\n"
-                    f"***Until:*** {discord.utils.format_dt(until, style='F')}\n"
-                    f"***Reason:*** {reason}"
-                ),
-                color=discord.Color.green(),
-                timestamp=discord.utils.utcnow()
-            )
-            if interaction.guild.icon:
-                dm.set_thumbnail(url=interaction.guild.icon.url)
-            await member.send(embed=dm)
-        except Exception:
-            pass
+        # Acknowledge now; the DM and moderation calls below can outlast the 3s window
+        await interaction.response.defer()
 
-        try:
-            await member.timeout(until, reason=f"Timed out by staff: {reason}")
-            e = self._dyno_style_embed("timed out", member, reason)
-            e.description += f"\n***Until:*** {discord.utils.format_dt(until, style='F')} • ***Duration:*** {duration}"
-            e.set_footer(text=f"User ID: {member.id}")
-            await interaction.response.send_message(embed=e)
-        except discord.Forbidden:
-            await interaction.response.send_message("❌ I don't have permission to timeout this member.", ephemeral=True)
+        await self._do_timeout(interaction, member, duration, timeout_duration, reason)
 
     # Untimeout
     @app_commands.command(name="untimeout", description="Remove timeout from a member")
     @app_commands.describe(member="The member to remove timeout from", reason="Reason for removing the timeout")
+    @app_commands.checks.cooldown(5, 10.0, key=lambda i: i.guild_id)
+    @app_commands.check(_action_rate_limit)
+    @_mod_guard("remove timeout from", need_hierarchy=False)
     async def untimeout(self, interaction: discord.Interaction, member: discord.Member, reason: Optional[str] = "No reason provided"):
         if member.timed_out_until is None:
             return await interaction.response.send_message("❌ This member is not currently timed out.", ephemeral=True)
-        if not isinstance(interaction.user, discord.Member):
-            return await interaction.response.send_message("❌ You must be a member of this server to use this command.", ephemeral=True)
-        if not has_moderation_permissions(interaction.user, member):
-            return await interaction.response.send_message("❌ You don't have permission to remove timeout from this member.", ephemeral=True)
 
-        # DM best-effort
-        try:
-            dm = discord.Embed(
-                title=f"Your timeout was removed in {interaction.guild.name}",
-                description=f"***Reason:*** {reason}",
-                color=discord.Color.green(),
-                timestamp=discord.utils.utcnow()
-            )
-            if interaction.guild.icon:
-                dm.set_thumbnail(url=interaction.guild.icon.url)
-            await member.send(embed=dm)
-        except Exception:
-            pass
+        # Acknowledge now; the DM and moderation calls below can outlast the 3s window
+        await interaction.response.defer()
 
-        try:
-            await member.timeout(None, reason=f"Timeout removed by staff: {reason}")
-            e = self._dyno_style_embed("untimed out", member, reason)
-            e.set_footer(text=f"User ID: {member.id}")
-            await interaction.response.send_message(embed=e)
-        except discord.Forbidden:
-            await interaction.response.send_message("❌ I don't have permission to remove timeout from this member.", ephemeral=True)
+        await self._do_untimeout(interaction, member, reason)
 
     # Unban (slash)
     @app_commands.command(name="unban", description="Unban a user from the server")
     @app_commands.describe(user_id="The ID of the user to unban", reason="Reason for the unban")
+    @app_commands.checks.cooldown(5, 10.0, key=lambda i: i.guild_id)
+    @app_commands.check(_action_rate_limit)
     async def unban(self, interaction: discord.Interaction, user_id: str, reason: Optional[str] = "No reason provided"):
+        try:
+            uid = int(user_id)
+        except ValueError:
+            return await interaction.response.send_message("❌ Invalid user ID provided.", ephemeral=True)
         if not isinstance(interaction.user, discord.Member) or not interaction.guild:
             return await interaction.response.send_message("❌ This command can only be used by server members.", ephemeral=True)
         if not interaction.user.guild_permissions.ban_members:
             return await interaction.response.send_message("❌ You don't have permission to unban members.", ephemeral=True)
+        self._count_action(interaction)
+
+        # Acknowledge now; the DM and moderation calls below can outlast the 3s window
+        await interaction.response.defer()
 
         try:
-            uid = int(user_id)
-            user = await self.bot.fetch_user(uid)
+            # Unban by id and let a 404 mean "not banned" instead of checking first
             try:
-                await interaction.guild.fetch_ban(user)
+                await self._gated("guild_ban", lambda: interaction.guild.unban(discord.Object(id=uid), reason=_audit("Unbanned", "staff", reason)))
             except discord.NotFound:
-                return await interaction.response.send_message("❌ This user is not banned from this server.", ephemeral=True)
+                return await interaction.followup.send("❌ This user is not banned from this server.", ephemeral=True)
+            # A user the client doesn't know shares no guild with the bot, so a DM would
+            # be refused anyway; name them from cache or by mention instead of fetching
+            user = self.bot.get_user(uid)
+            target = user or self._cached_user(uid) or discord.Object(id=uid)
+
+            now = discord.utils.utcnow()
+
+            e = self._dyno_style_embed("unbanned", target, reason, now=now)
+            await interaction.followup.send(embed=e)
+
+            # DM the user about the unban (best effort) once the moderator has their answer
+            if user is not None:
+                unban_embed = self._dm_embed(
+                    interaction.guild,
+                    f"You have been unbanned from {interaction.guild.name}",
+                    f"You have been unbanned by a staff member and can now rejoin the server.\n\n**Reason:** {reason}",
+                    now=now
+                )
+                self._spawn(self._send_unban_dm(user, unban_embed, "manual unban"))
+        except discord.NotFound:
+            await interaction.followup.send(_ERR_USER_NOT_FOUND, ephemeral=True)
+        except discord.Forbidden:
+            await interaction.followup.send("❌ I don't have permission to unban users.", ephemeral=True)
+        except discord.HTTPException as e:
+            await interaction.followup.send(_http_error("Failed to unban user", e), ephemeral=True)
 
-            await interaction.guild.unban(user, reason=f"Unbanned by staff: {reason}")
-            
-            # Try to DM the user about the unban (best effort)
+    # Mass ban (slash)
+    # Discord's bulk-ban endpoint accepts at most 200 users per request
+    _BULK_BAN_CHUNK = 200
+    # Most IDs one /massban accepts (5 bulk requests), so a run stays well inside
+    # the 15 minute interaction window and doesn't pin the cooldown for long
+    _MASSBAN_MAX = 1000
+
+    @app_commands.command(name="massban", description="Ban many users by ID in as few requests as possible")
+    @app_commands.describe(
+        user_ids="User IDs separated by spaces or commas (up to 1000)",
+        reason="Reason for the bans",
+        delete_messages="Number of days of messages to delete (0-7)"
+    )
+    @app_commands.checks.cooldown(1, 10.0, key=lambda i: i.guild_id)
+    @app_commands.check(_action_rate_limit)
+    async def massban(self, interaction: discord.Interaction, user_ids: str, reason: Optional[str] = "No reason provided", delete_messages: Optional[int] = 0):
+        delete_messages = delete_messages or 0
+        if not 0 <= delete_messages <= 7:
+            return await interaction.response.send_message("❌ Delete messages must be between 0 and 7 days.", ephemeral=True)
+        guild = interaction.guild
+        if not guild:
+            return await interaction.response.send_message(_ERR_GUILD_ONLY, ephemeral=True)
+        if not isinstance(interaction.user, discord.Member):
+            return await interaction.response.send_message(_ERR_MUST_BE_MEMBER, ephemeral=True)
+        if not interaction.user.guild_permissions.ban_members:
+            return await interaction.response.send_message("❌ You don't have permission to ban members.", ephemeral=True)
+
+        tokens = [t for t in re.split(r"[\s,]+", user_ids) if t]
+        ids = {int(t) for t in tokens if t.isdigit()}
+        if len(ids) > self._MASSBAN_MAX:
+            return await interaction.response.send_message(
+                f"❌ Too many IDs ({len(ids)}); /massban takes at most {self._MASSBAN_MAX} at a time.", ephemeral=True)
+        invalid = [t for t in tokens if not t.isdigit()]
+        ids -= {guild.owner_id, guild.me.id, interaction.user.id}
+        # Same hierarchy rules as /ban for anyone still in the server. top_role scans
+        # the member's roles on every access, so resolve the ceiling once, not per target.
+        ceiling = guild.me.top_role
+        if interaction.user.id != guild.owner_id:
+            ceiling = min(ceiling, interaction.user.top_role)
+        skipped = 0
+        for uid in list(ids):
+            member = guild.get_member(uid)
+            if member and not member.top_role < ceiling:
+                ids.discard(uid)
+                skipped += 1
+        if not ids:
+            return await interaction.response.send_message("❌ No bannable user IDs provided.", ephemeral=True)
+        # One bulk request batch counts as one action against the per-minute budget
+        self._count_action(interaction)
+
+        # Acknowledge now; a few hundred bans can take a while
+        await interaction.response.defer()
+
+        users = [discord.Object(id=uid) for uid in ids]
+        audit = _audit("Mass-banned", interaction.user, reason)
+        banned = 0
+        failed: list[int] = []
+        for i in range(0, len(users), self._BULK_BAN_CHUNK):
+            chunk = users[i:i + self._BULK_BAN_CHUNK]
             try:
-                unban_embed = discord.Embed(
-                    title=f"You have been unbanned from {interaction.guild.name}",
-                    description=f"You have been unbanned by a staff member and can now rejoin the server.\n\n**Reason:** {reason}",
-                    color=discord.Color.green(),
-                    timestamp=discord.utils.utcnow()
-                )
-                if interaction.guild.icon:
-                    unban_embed.set_thumbnail(url=interaction.guild.icon.url)
-                await user.send(embed=unban_embed)
-                self.logger.info(f"Successfully sent manual unban DM to {user} ({user.id})")
+                result = await self._gated("guild_ban", lambda: guild.bulk_ban(
+                    chunk, reason=audit, delete_message_seconds=delete_messages * 86400))
             except discord.Forbidden:
-                self.logger.warning(f"Failed to send manual unban DM to {user} ({user.id}) - user has DMs disabled or blocked the bot")
+                return await interaction.followup.send("❌ I don't have permission to ban users.", ephemeral=True)
             except discord.HTTPException as e:
-                self.logger.warning(f"Failed to send manual unban DM to {user} ({user.id}) - HTTP error: {e}")
-            except Exception as e:
-                self.logger.warning(f"Failed to send manual unban DM to {user} ({user.id}) - unexpected error: {e}")
-            
-            e = self._dyno_style_embed("unbanned", user, reason)
-            e.set_footer(text=f"User ID: {user.id}")
-            await interaction.response.send_message(embed=e)
-        except ValueError:
-            await interaction.response.send_message("❌ Invalid user ID provided.", ephemeral=True)
-        except discord.NotFound:
-            await interaction.response.send_message("❌ User not found.", ephemeral=True)
-        except discord.Forbidden:
-            await interaction.response.send_message("❌ I don't have permission to unban users.", ephemeral=True)
+                return await interaction.followup.send(_http_error("Failed to ban users", e), ephemeral=True)
+            banned += len(result.banned)
+            failed.extend(obj.id for obj in result.failed)
+
+        description = f"**{banned}** user(s) were banned.\n***Reason:*** {reason}"
+        if skipped:
+            description += f"\n***Skipped (role hierarchy):*** {skipped}"
+        if invalid:
+            shown = ", ".join(discord.utils.escape_markdown(t[:32]) for t in invalid[:10])
+            more = f" (+{len(invalid) - 10} more)" if len(invalid) > 10 else ""
+            description += f"\n***Ignored (not an ID):*** {shown}{more}"
+        if failed:
+            shown = ", ".join(map(str, failed[:20]))
+            more = f" (+{len(failed) - 20} more)" if len(failed) > 20 else ""
+            description += f"\n***Failed IDs:*** {shown}{more}"
+        e = discord.Embed.from_dict({**self._DYNO_TEMPLATE, "description": description})
+        e.timestamp = discord.utils.utcnow()
+        await self._reply(interaction, embed=e)
 
     # ------------------------------
     # Purge variants (slash)
     # ------------------------------
+    async def _precheck(self, interaction: discord.Interaction, amount: int, allow_whitelist: bool = False) -> bool:
+        """Shared purge guards (server member, Manage Messages, 1-100); reply and return False on failure."""
+        user = interaction.user
+        if not isinstance(user, discord.Member) or not interaction.guild:
+            msg = _ERR_GUILD_ONLY
+        elif allow_whitelist and not has_mod_permissions(user, self.bot, "manage_messages"):
+            msg = "❌ You need **Manage Messages** permission or be on the mod whitelist."
+        elif not allow_whitelist and not user.guild_permissions.manage_messages:
+            msg = _ERR_NEED_MANAGE_MESSAGES
+        elif not 1 <= amount <= 100:
+            msg = _ERR_BAD_AMOUNT
+        else:
+            return True
+        await interaction.response.send_message(msg, ephemeral=True)
+        return False
+
     @app_commands.command(name="purge", description="Delete recent messages (optionally from one user).")
     @app_commands.describe(amount="How many messages to scan (1–100)", user="Only delete messages from this user (optional)")
     async def purge(self, interaction: discord.Interaction, amount: int, user: Optional[discord.Member] = None):
-        if not isinstance(interaction.user, discord.Member) or not interaction.guild:
-            return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
-        
-        # Check if user has mod permissions (Discord perms OR mod whitelist)
-        from utils.permissions import has_mod_permissions
-        if not has_mod_permissions(interaction.user, self.bot, "manage_messages"):
-            return await interaction.response.send_message("❌ You need **Manage Messages** permission or be on the mod whitelist.", ephemeral=True)
-        
-        if amount < 1 or amount > 100:
-            return await interaction.response.send_message("❌ Amount must be between 1 and 100.", ephemeral=True)
+        if not await self._precheck(interaction, amount, allow_whitelist=True):
+            return
 
         await interaction.response.defer(ephemeral=True)
         try:
@@ -538,21 +1052,13 @@ class ModerationCog(commands.Cog):
                 deleted = await interaction.channel.purge(limit=amount)
                 await interaction.followup.send(f"🧹 Deleted **{len(deleted)}** messages.", ephemeral=True)
         except discord.Forbidden:
-            await interaction.followup.send("❌ I don't have permission to delete messages.", ephemeral=True)
+            await interaction.followup.send(_ERR_NO_DELETE_PERMS, ephemeral=True)
 
     @app_commands.command(name="purge_attachments", description="Delete recent messages that contain attachments.")
     @app_commands.describe(amount="How many messages to scan (1–100)")
     async def purge_attachments(self, interaction: discord.Interaction, amount: int):
-        if not isinstance(interaction.user, discord.Member) or not interaction.guild:
-            return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
-        
-        # Check if user has mod permissions (Discord perms OR mod whitelist)
-        from utils.permissions import has_mod_permissions
-        if not has_mod_permissions(interaction.user, self.bot, "manage_messages"):
-            return await interaction.response.send_message("❌ You need **Manage Messages** permission or be on the mod whitelist.", ephemeral=True)
-        
-        if amount < 1 or amount > 100:
-            return await interaction.response.send_message("❌ Amount must be between 1 and 100.", ephemeral=True)
+        if not await self._precheck(interaction, amount, allow_whitelist=True):
+            return
 
         await interaction.response.defer(ephemeral=True)
         try:
@@ -561,17 +1067,13 @@ class ModerationCog(commands.Cog):
             deleted = await interaction.channel.purge(limit=amount * 3, check=check)
             await interaction.followup.send(f"🧹 Deleted **{len(deleted)}** messages with attachments.", ephemeral=True)
         except discord.Forbidden:
-            await interaction.followup.send("❌ I don't have permission to delete messages.", ephemeral=True)
+            await interaction.followup.send(_ERR_NO_DELETE_PERMS, ephemeral=True)
 
     @app_commands.command(name="purge_invites", description="Delete recent messages that contain Discord invite links.")
     @app_commands.describe(amount="How many messages to scan (1–100)")
     async def purge_invites(self, interaction: discord.Interaction, amount: int):
-        if not isinstance(interaction.user, discord.Member) or not interaction.guild:
-            return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
-        if not interaction.user.guild_permissions.manage_messages:
-            return await interaction.response.send_message("❌ You need **Manage Messages**.", ephemeral=True)
-        if amount < 1 or amount > 100:
-            return await interaction.response.send_message("❌ Amount must be between 1 and 100.", ephemeral=True)
+        if not await self._precheck(interaction, amount):
+            return
 
         regex = self._invite_regex()
         await interaction.response.defer(ephemeral=True)
@@ -581,17 +1083,13 @@ class ModerationCog(commands.Cog):
             deleted = await interaction.channel.purge(limit=amount * 3, check=check)
             await interaction.followup.send(f"🧹 Deleted **{len(deleted)}** messages containing invites.", ephemeral=True)
         except discord.Forbidden:
-            await interaction.followup.send("❌ I don't have permission to delete messages.", ephemeral=True)
+            await interaction.followup.send(_ERR_NO_DELETE_PERMS, ephemeral=True)
 
     @app_commands.command(name="purge_links", description="Delete recent messages that contain any URL.")
     @app_commands.describe(amount="How many messages to scan (1–100)")
     async def purge_links(self, interaction: discord.Interaction, amount: int):
-        if not isinstance(interaction.user, discord.Member) or not interaction.guild:
-            return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
-        if not interaction.user.guild_permissions.manage_messages:
-            return await interaction.response.send_message("❌ You need **Manage Messages**.", ephemeral=True)
-        if amount < 1 or amount > 100:
-            return await interaction.response.send_message("❌ Amount must be between 1 and 100.", ephemeral=True)
+        if not await self._precheck(interaction, amount):
+            return
 
         url_rx = self._url_regex()
         await interaction.response.defer(ephemeral=True)
@@ -601,17 +1099,13 @@ class ModerationCog(commands.Cog):
             deleted = await interaction.channel.purge(limit=amount * 3, check=check)
             await interaction.followup.send(f"🧹 Deleted **{len(deleted)}** messages with links.", ephemeral=True)
         except discord.Forbidden:
-            await interaction.followup.send("❌ I don't have permission to delete messages.", ephemeral=True)
+            await interaction.followup.send(_ERR_NO_DELETE_PERMS, ephemeral=True)
 
     @app_commands.command(name="purge_bots", description="Delete recent messages sent by bots.")
     @app_commands.describe(amount="How many messages to scan (1–100)")
     async def purge_bots(self, interaction: discord.Interaction, amount: int):
-        if not isinstance(interaction.user, discord.Member) or not interaction.guild:
-            return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
-        if not interaction.user.guild_permissions.manage_messages:
-            return await interaction.response.send_message("❌ You need **Manage Messages**.", ephemeral=True)
-        if amount < 1 or amount > 100:
-            return await interaction.response.send_message("❌ Amount must be between 1 and 100.", ephemeral=True)
+        if not await self._precheck(interaction, amount):
+            return
 
         await interaction.response.defer(ephemeral=True)
         try:
@@ -620,17 +1114,13 @@ class ModerationCog(commands.Cog):
             deleted = await interaction.channel.purge(limit=amount * 2, check=check)
             await interaction.followup.send(f"🧹 Deleted **{len(deleted)}** bot messages.", ephemeral=True)
         except discord.Forbidden:
-            await interaction.followup.send("❌ I don't have permission to delete messages.", ephemeral=True)
+            await interaction.followup.send(_ERR_NO_DELETE_PERMS, ephemeral=True)
 
     @app_commands.command(name="purge_text", description="Delete recent messages that contain a specific text (case-insensitive).")
     @app_commands.describe(amount="How many messages to scan (1–100)", query="Substring to match (case-insensitive)")
     async def purge_text(self, interaction: discord.Interaction, amount: int, query: str):
-        if not isinstance(interaction.user, discord.Member) or not interaction.guild:
-            return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
-        if not interaction.user.guild_permissions.manage_messages:
-            return await interaction.response.send_message("❌ You need **Manage Messages**.", ephemeral=True)
-        if amount < 1 or amount > 100:
-            return await interaction.response.send_message("❌ Amount must be between 1 and 100.", ephemeral=True)
+        if not await self._precheck(interaction, amount):
+            return
         if not query.strip():
             return await interaction.response.send_message("❌ Query cannot be empty.", ephemeral=True)
 
@@ -642,92 +1132,65 @@ class ModerationCog(commands.Cog):
             deleted = await interaction.channel.purge(limit=amount * 3, check=check)
             await interaction.followup.send(f"🧹 Deleted **{len(deleted)}** messages containing `{query}`.", ephemeral=True)
         except discord.Forbidden:
-            await interaction.followup.send("❌ I don't have permission to delete messages.", ephemeral=True)
+            await interaction.followup.send(_ERR_NO_DELETE_PERMS, ephemeral=True)
 
     @app_commands.command(name="purge_before", description="Delete messages sent before a specific message.")
     @app_commands.describe(amount="How many messages to scan (1–100)", message_id="Message ID to use as the 'before' anchor")
     async def purge_before(self, interaction: discord.Interaction, amount: int, message_id: str):
-        if not isinstance(interaction.user, discord.Member) or not interaction.guild:
-            return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
-        if not interaction.user.guild_permissions.manage_messages:
-            return await interaction.response.send_message("❌ You need **Manage Messages**.", ephemeral=True)
-        if amount < 1 or amount > 100:
-            return await interaction.response.send_message("❌ Amount must be between 1 and 100.", ephemeral=True)
+        if not await self._precheck(interaction, amount):
+            return
 
         await interaction.response.defer(ephemeral=True)
         try:
             mid = int(message_id)
             anchor = await interaction.channel.fetch_message(mid)
-        except Exception:
+        except (ValueError, discord.NotFound, discord.Forbidden, discord.HTTPException):
             return await interaction.followup.send("❌ Couldn't find that message ID in this channel.", ephemeral=True)
 
         try:
             deleted = await interaction.channel.purge(limit=amount, before=anchor)
             await interaction.followup.send(f"🧹 Deleted **{len(deleted)}** messages before [this message]({anchor.jump_url}).", ephemeral=True)
         except discord.Forbidden:
-            await interaction.followup.send("❌ I don't have permission to delete messages.", ephemeral=True)
+            await interaction.followup.send(_ERR_NO_DELETE_PERMS, ephemeral=True)
 
     @app_commands.command(name="purge_after", description="Delete messages sent after a specific message.")
     @app_commands.describe(amount="How many messages to scan (1–100)", message_id="Message ID to use as the 'after' anchor")
     async def purge_after(self, interaction: discord.Interaction, amount: int, message_id: str):
-        if not isinstance(interaction.user, discord.Member) or not interaction.guild:
-            return await interaction.response.send_message("❌ This command can only be used in a server.", ephemeral=True)
-        if not interaction.user.guild_permissions.manage_messages:
-            return await interaction.response.send_message("❌ You need **Manage Messages**.", ephemeral=True)
-        if amount < 1 or amount > 100:
-            return await interaction.response.send_message("❌ Amount must be between 1 and 100.", ephemeral=True)
+        if not await self._precheck(interaction, amount):
+            return
 
         await interaction.response.defer(ephemeral=True)
         try:
             mid = int(message_id)
             anchor = await interaction.channel.fetch_message(mid)
-        except Exception:
+        except (ValueError, discord.NotFound, discord.Forbidden, discord.HTTPException):
             return await interaction.followup.send("❌ Couldn't find that message ID in this channel.", ephemeral=True)
 
         try:
             deleted = await interaction.channel.purge(limit=amount, after=anchor)
             await interaction.followup.send(f"🧹 Deleted **{len(deleted)}** messages after [this message]({anchor.jump_url}).", ephemeral=True)
         except discord.Forbidden:
-            await interaction.followup.send("❌ I don't have permission to delete messages.", ephemeral=True)
+            await interaction.followup.send(_ERR_NO_DELETE_PERMS, ephemeral=True)
 
     # ==============================
     # Prefix commands (message)
     # ==============================
 
     @commands.command(name="kick")
+    @commands.max_concurrency(3, per=commands.BucketType.guild, wait=True)
+    @commands.check(_prefix_action_rate_limit)
     async def prefix_kick(self, ctx, member: discord.Member, *, reason="No reason provided"):
-        await self.delete_command_message(ctx)
-        if not isinstance(ctx.author, discord.Member) or not ctx.guild:
+        self._spawn(self.delete_command_message(ctx))
+        if not await self._guard(ctx, member, "kick"):
             return
-        if not has_moderation_permissions(ctx.author, member):
-            return await ctx.send("❌ You don't have permission to kick this member.", delete_after=5)
-        if not has_higher_role(ctx.guild.me, member):
-            return await ctx.send("❌ I cannot kick this member due to role hierarchy.", delete_after=5)
 
-        try:
-            dm = discord.Embed(
-                title=f"You were kicked from {ctx.guild.name}",
-                description=f"***Reason:*** {reason}",
-                color=discord.Color.green(),
-                timestamp=discord.utils.utcnow()
-            )
-            if ctx.guild.icon:
-                dm.set_thumbnail(url=ctx.guild.icon.url)
-            await member.send(embed=dm)
-        except Exception:
-            pass
-
-        try:
-            await member.kick(reason=f"Kicked by staff: {reason}")
-            e = self._dyno_style_embed("kicked", member, reason)
-            e.set_footer(text=f"User ID: {member.id}")
-            await ctx.send(embed=e)
-        except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to kick this member.", delete_after=5)
+        await self._do_kick(ctx, member, reason)
 
     @commands.command(name="ban")
+    @commands.max_concurrency(3, per=commands.BucketType.guild, wait=True)
+    @commands.check(_prefix_action_rate_limit)
     async def prefix_ban(self, ctx, target, *, reason="No reason provided"):
-        await self.delete_command_message(ctx)
+        self._spawn(self.delete_command_message(ctx))
         if not isinstance(ctx.author, discord.Member) or not ctx.guild:
             return
         
@@ -778,10 +1241,10 @@ class ModerationCog(commands.Cog):
                                 "not in the server.", delete_after=5)
                         
                         try:
-                            user = await self.bot.fetch_user(user_id)
+                            user = await self._resolve_user(user_id)
                         except discord.NotFound:
                             return await ctx.send(
-                                "❌ User not found.", delete_after=5)
+                                _ERR_USER_NOT_FOUND, delete_after=5)
                         except discord.HTTPException:
                             return await ctx.send(
                                 "❌ Failed to fetch user information.", 
@@ -796,67 +1259,23 @@ class ModerationCog(commands.Cog):
                 "❌ Could not resolve user. Please try again.", delete_after=5)
         
         # Permission checks for members in server
-        if member:
-            if not has_moderation_permissions(ctx.author, member):
-                return await ctx.send(
-                    "❌ You don't have permission to ban this member.",
-                    delete_after=5)
-            if not has_higher_role(ctx.guild.me, member):
-                return await ctx.send(
-                    "❌ I cannot ban this member due to role hierarchy.",
-                    delete_after=5)
-
-        # Check if user is already banned
-        try:
-            await ctx.guild.fetch_ban(user)
-            return await ctx.send(
-                f"❌ {user.mention} is already banned.", delete_after=5)
-        except discord.NotFound:
-            pass  # User is not banned, continue
-        except discord.Forbidden:
-            return await ctx.send(
-                "❌ I don't have permission to check bans.", delete_after=5)
-
-        # Try to DM the user (best effort, only if they're in server)
-        if member:
-            try:
-                dm = discord.Embed(
-                    title=f"You were banned from {ctx.guild.name}",
-                    description=f"***Reason:*** {reason}",
-                    color=discord.Color.red(),
-                    timestamp=discord.utils.utcnow()
-                )
-                if ctx.guild.icon:
-                    dm.set_thumbnail(url=ctx.guild.icon.url)
-                await user.send(embed=dm)
-            except Exception:
-                pass
+        if member and not await self._guard(ctx, member, "ban"):
+            return
 
-        try:
-            await ctx.guild.ban(
-                user, reason=f"Banned by {ctx.author}: {reason}")
-            
-            # Create success embed
-            e = self._dyno_style_embed("banned", user, reason)
-            e.set_footer(text=f"User ID: {user.id}")
-            await ctx.send(embed=e)
-            
-        except discord.Forbidden:
-            await ctx.send(
-                "❌ I don't have permission to ban this user.", delete_after=5)
-        except discord.HTTPException as e:
-            await ctx.send(f"❌ Failed to ban user: {e}", delete_after=5)
+        await self._do_ban(ctx, user, member, reason, None)
 
     @commands.command(name="tempban")
+    @commands.max_concurrency(3, per=commands.BucketType.guild, wait=True)
+    @commands.check(_prefix_action_rate_limit)
     async def prefix_tempban(self, ctx, target: str, duration: str, *, reason="No reason provided"):
         """Temporarily ban a member or user from the server (prefix version)."""
         if not ctx.guild:
-            return await ctx.send("❌ This command can only be used in a server.", delete_after=5)
+            return await ctx.send(_ERR_GUILD_ONLY, delete_after=5)
         if not isinstance(ctx.author, discord.Member):
-            return await ctx.send("❌ You must be a member of this server to use this command.", delete_after=5)
+            return await ctx.send(_ERR_MUST_BE_MEMBER, delete_after=5)
         
         # Auto-delete command message
-        await self.delete_command_message(ctx)
+        self._spawn(self.delete_command_message(ctx))
         
         # Parse duration
         ban_duration = self._parse_duration(duration)
@@ -890,10 +1309,8 @@ class ModerationCog(commands.Cog):
         
         # If we found a member, do permission checks
         if member:
-            if not has_moderation_permissions(ctx.author, member):
-                return await ctx.send("❌ You don't have permission to ban this member.", delete_after=5)
-            if not has_higher_role(ctx.guild.me, member):
-                return await ctx.send("❌ I cannot ban this member due to role hierarchy.", delete_after=5)
+            if not await self._guard(ctx, member, "ban"):
+                return
             user = member
         else:
             # User not in server, try to fetch user object
@@ -905,58 +1322,19 @@ class ModerationCog(commands.Cog):
                 return await ctx.send("❌ You need ban permissions to ban users not in the server.", delete_after=5)
             
             try:
-                user = await self.bot.fetch_user(user_id)
+                user = await self._resolve_user(user_id)
             except discord.NotFound:
-                return await ctx.send("❌ User not found.", delete_after=5)
+                return await ctx.send(_ERR_USER_NOT_FOUND, delete_after=5)
             except discord.HTTPException:
                 return await ctx.send("❌ Failed to fetch user information.", delete_after=5)
 
-        # Check if user is already banned
-        try:
-            ban_entry = await ctx.guild.fetch_ban(user)
-            return await ctx.send(f"❌ {user.mention} is already banned.", delete_after=5)
-        except discord.NotFound:
-            pass  # User is not banned, continue
-        except discord.Forbidden:
-            return await ctx.send("❌ I don't have permission to check bans.", delete_after=5)
-
-        # Try to DM the user (best effort)
-        if member:  # Only try to DM if they're in the server
-            try:
-                unban_time = discord.utils.utcnow() + ban_duration
-                dm = discord.Embed(
-                    title=f"You were temporarily banned from {ctx.guild.name}",
-                    description=f"***Reason:*** {reason}\n***Duration:*** {duration}\n***Unban Time:*** <t:{int(unban_time.timestamp())}:F>",
-                    color=discord.Color.red(),
-                    timestamp=discord.utils.utcnow()
-                )
-                if ctx.guild.icon:
-                    dm.set_thumbnail(url=ctx.guild.icon.url)
-                await user.send(embed=dm)
-            except Exception:
-                pass
-
-        try:
-            await ctx.guild.ban(user, reason=f"Tempban by {ctx.author}: {reason} (Duration: {duration})", delete_message_days=0)
-            
-            # Schedule unban
-            unban_time = discord.utils.utcnow() + ban_duration
-            self.bot.loop.create_task(self._schedule_unban(ctx.guild, user, ban_duration))
-            
-            # Create success embed
-            e = self._dyno_style_embed("temporarily banned", user, reason)
-            e.description += f"\n***Duration:*** {duration}\n***Unban Time:*** <t:{int(unban_time.timestamp())}:R>"
-            e.set_footer(text=f"User ID: {user.id}")
-            await ctx.send(embed=e)
-            
-        except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to ban this user.", delete_after=5)
-        except discord.HTTPException as e:
-            await ctx.send(f"❌ Failed to ban user: {e}", delete_after=5)
+        await self._do_tempban(ctx, user, member, reason, duration, ban_duration, 0)
 
     @commands.command(name="timeout")
+    @commands.max_concurrency(3, per=commands.BucketType.guild, wait=True)
+    @commands.check(_prefix_action_rate_limit)
     async def prefix_timeout(self, ctx, member: discord.Member, duration: str, *, reason="No reason provided"):
-        await self.delete_command_message(ctx)
+        self._spawn(self.delete_command_message(ctx))
         
         # Parse duration
         timeout_duration = self._parse_duration(duration)
@@ -968,113 +1346,62 @@ class ModerationCog(commands.Cog):
         if timeout_duration > max_duration:
             return await ctx.send("❌ Duration cannot exceed 28 days.", delete_after=5)
             
-        if not isinstance(ctx.author, discord.Member) or not ctx.guild:
+        if not await self._guard(ctx, member, "timeout"):
             return
-        if not has_moderation_permissions(ctx.author, member):
-            return await ctx.send("❌ You don't have permission to timeout this member.", delete_after=5)
-        if not has_higher_role(ctx.guild.me, member):
-            return await ctx.send("❌ I cannot timeout this member due to role hierarchy.", delete_after=5)
-
-        until = discord.utils.utcnow() + timeout_duration
 
-        try:
-            dm = discord.Embed(
-                title=f"You were timed out in {ctx.guild.name}",
-                description=(
-                    f"***Duration:*** {duration}\n"
-                    f"***Until:*** {discord.utils.format_dt(until, style='F')}\n"
-                    f"***Reason:*** {reason}"
-                ),
-                color=discord.Color.green(),
-                timestamp=discord.utils.utcnow()
-            )
-            if ctx.guild.icon:
-                dm.set_thumbnail(url=ctx.guild.icon.url)
-            await member.send(embed=dm)
-        except Exception:
-            pass
-
-        try:
-            await member.timeout(until, reason=f"Timed out by staff: {reason}")
-            e = self._dyno_style_embed("timed out", member, reason)
-            e.description += f"\n***Until:*** {discord.utils.format_dt(until, style='F')} • ***Duration:*** {duration}"
-            e.set_footer(text=f"User ID: {member.id}")
-            await ctx.send(embed=e)
-        except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to timeout this member.", delete_after=5)
+        await self._do_timeout(ctx, member, duration, timeout_duration, reason)
 
     @commands.command(name="untimeout")
+    @commands.max_concurrency(3, per=commands.BucketType.guild, wait=True)
+    @commands.check(_prefix_action_rate_limit)
     async def prefix_untimeout(self, ctx, member: discord.Member, *, reason="No reason provided"):
-        await self.delete_command_message(ctx)
-        if not isinstance(ctx.author, discord.Member) or not ctx.guild:
+        self._spawn(self.delete_command_message(ctx))
+        if not await self._guard(ctx, member, "remove timeout from", need_hierarchy=False):
             return
-        if not has_moderation_permissions(ctx.author, member):
-            return await ctx.send("❌ You don't have permission to remove timeout from this member.", delete_after=5)
 
-        try:
-            dm = discord.Embed(
-                title=f"Your timeout was removed in {ctx.guild.name}",
-                description=f"***Reason:*** {reason}",
-                color=discord.Color.green(),
-                timestamp=discord.utils.utcnow()
-            )
-            if ctx.guild.icon:
-                dm.set_thumbnail(url=ctx.guild.icon.url)
-            await member.send(embed=dm)
-        except Exception:
-            pass
-
-        try:
-            await member.timeout(None, reason=f"Timeout removed by staff: {reason}")
-            e = self._dyno_style_embed("untimed out", member, reason)
-            e.set_footer(text=f"User ID: {member.id}")
-            await ctx.send(embed=e)
-        except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to remove timeout from this member.", delete_after=5)
+        await self._do_untimeout(ctx, member, reason)
 
     @commands.command(name="unban")
+    @commands.max_concurrency(3, per=commands.BucketType.guild, wait=True)
+    @commands.check(_prefix_action_rate_limit)
     async def prefix_unban(self, ctx, user_id: int, *, reason: str = "No reason provided"):
-        await self.delete_command_message(ctx)
+        self._spawn(self.delete_command_message(ctx))
         if not ctx.guild or not isinstance(ctx.author, discord.Member):
             return
         if not ctx.author.guild_permissions.ban_members:
             return await ctx.send("❌ You don't have permission to unban members.", delete_after=5)
+        self._count_action(ctx)
 
         try:
-            user = await self.bot.fetch_user(user_id)
+            # Unban by id and let a 404 mean "not banned" instead of checking first
             try:
-                await ctx.guild.fetch_ban(user)
+                await self._gated("guild_ban", lambda: ctx.guild.unban(discord.Object(id=user_id), reason=_audit("Unbanned", "staff", reason)))
             except discord.NotFound:
                 return await ctx.send("❌ That user is not banned from this server.", delete_after=5)
+            # Try the client and our fetched-user cache without another REST call;
+            # an uncached user is named by mention and told apart in the reply
+            user = self.bot.get_user(user_id) or self._cached_user(user_id)
+            target = user or discord.Object(id=user_id)
 
-            await ctx.guild.unban(user, reason=f"Unbanned by staff: {reason}")
-            
-            # Try to DM the user about the unban (best effort)
-            try:
-                unban_embed = discord.Embed(
-                    title=f"You have been unbanned from {ctx.guild.name}",
-                    description=f"You have been unbanned by a staff member and can now rejoin the server.\n\n**Reason:** {reason}",
-                    color=discord.Color.green(),
-                    timestamp=discord.utils.utcnow()
-                )
-                if ctx.guild.icon:
-                    unban_embed.set_thumbnail(url=ctx.guild.icon.url)
-                await user.send(embed=unban_embed)
-                self.logger.info(f"Successfully sent manual unban DM to {user} ({user.id})")
-            except discord.Forbidden:
-                self.logger.warning(f"Failed to send manual unban DM to {user} ({user.id}) - user has DMs disabled or blocked the bot")
-            except discord.HTTPException as e:
-                self.logger.warning(f"Failed to send manual unban DM to {user} ({user.id}) - HTTP error: {e}")
-            except Exception as e:
-                self.logger.warning(f"Failed to send manual unban DM to {user} ({user.id}) - unexpected error: {e}")
-            
-            e = self._dyno_style_embed("unbanned", user, reason)
-            e.set_footer(text=f"User ID: {user.id}")
+            now = discord.utils.utcnow()
+
+            extra = "" if user is not None else "\n***DM:*** not sent (user not cached)"
+            e = self._dyno_style_embed("unbanned", target, reason, now=now, extra=extra)
             await ctx.send(embed=e)
+
+            # DM the user about the unban (best effort) once the moderator has their answer
+            if user is not None:
+                unban_embed = self._dm_embed(
+                    ctx.guild,
+                    f"You have been unbanned from {ctx.guild.name}",
+                    f"You have been unbanned by a staff member and can now rejoin the server.\n\n**Reason:** {reason}",
+                    now=now
+                )
+                self._spawn(self._send_unban_dm(user, unban_embed, "manual unban"))
         except discord.NotFound:
-            await ctx.send("❌ User not found.", delete_after=5)
+            await ctx.send(_ERR_USER_NOT_FOUND, delete_after=5)
         except discord.HTTPException as err:
-            await ctx.send(f"❌ Failed to unban user: {err}", delete_after=5)
+            await ctx.send(_http_error("Failed to unban user", err), delete_after=5)
 
     # ------------------------------
     # Purge variants (prefix)
@@ -1084,7 +1411,7 @@ class ModerationCog(commands.Cog):
     async def p_purge(self, ctx, amount: int, member: Optional[discord.Member] = None):
         await self.delete_command_message(ctx)
         if amount < 1 or amount > 100:
-            return await ctx.send("❌ Amount must be between 1 and 100.", delete_after=5)
+            return await ctx.send(_ERR_BAD_AMOUNT, delete_after=5)
         try:
             if member:
                 def check(m: discord.Message):
@@ -1095,28 +1422,28 @@ class ModerationCog(commands.Cog):
                 deleted = await ctx.channel.purge(limit=amount)
                 await ctx.send(f"🧹 Deleted **{len(deleted)}** messages", delete_after=5)
         except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to delete messages.", delete_after=5)
+            await ctx.send(_ERR_NO_DELETE_PERMS, delete_after=5)
 
     @commands.command(name="purgeattachments")
     @mod_check("manage_messages")
     async def p_purge_attachments(self, ctx, amount: int):
         await self.delete_command_message(ctx)
         if amount < 1 or amount > 100:
-            return await ctx.send("❌ Amount must be between 1 and 100.", delete_after=5)
+            return await ctx.send(_ERR_BAD_AMOUNT, delete_after=5)
         try:
             def check(m: discord.Message):
                 return bool(m.attachments)
             deleted = await ctx.channel.purge(limit=amount * 3, check=check)
             await ctx.send(f"🧹 Deleted **{len(deleted)}** messages with attachments", delete_after=5)
         except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to delete messages.", delete_after=5)
+            await ctx.send(_ERR_NO_DELETE_PERMS, delete_after=5)
 
     @commands.command(name="purgeinvites")
     @mod_check("manage_messages")
     async def p_purge_invites(self, ctx, amount: int):
         await self.delete_command_message(ctx)
         if amount < 1 or amount > 100:
-            return await ctx.send("❌ Amount must be between 1 and 100.", delete_after=5)
+            return await ctx.send(_ERR_BAD_AMOUNT, delete_after=5)
         regex = self._invite_regex()
         try:
             def check(m: discord.Message):
@@ -1124,14 +1451,14 @@ class ModerationCog(commands.Cog):
             deleted = await ctx.channel.purge(limit=amount * 3, check=check)
             await ctx.send(f"🧹 Deleted **{len(deleted)}** messages containing invites", delete_after=5)
         except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to delete messages.", delete_after=5)
+            await ctx.send(_ERR_NO_DELETE_PERMS, delete_after=5)
 
     @commands.command(name="purgelinks")
     @mod_check("manage_messages")
     async def p_purge_links(self, ctx, amount: int):
         await self.delete_command_message(ctx)
         if amount < 1 or amount > 100:
-            return await ctx.send("❌ Amount must be between 1 and 100.", delete_after=5)
+            return await ctx.send(_ERR_BAD_AMOUNT, delete_after=5)
         url_rx = self._url_regex()
         try:
             def check(m: discord.Message):
@@ -1139,28 +1466,28 @@ class ModerationCog(commands.Cog):
             deleted = await ctx.channel.purge(limit=amount * 3, check=check)
             await ctx.send(f"🧹 Deleted **{len(deleted)}** messages with links", delete_after=5)
         except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to delete messages.", delete_after=5)
+            await ctx.send(_ERR_NO_DELETE_PERMS, delete_after=5)
 
     @commands.command(name="purgebots")
     @mod_check("manage_messages")
     async def p_purge_bots(self, ctx, amount: int):
         await self.delete_command_message(ctx)
         if amount < 1 or amount > 100:
-            return await ctx.send("❌ Amount must be between 1 and 100.", delete_after=5)
+            return await ctx.send(_ERR_BAD_AMOUNT, delete_after=5)
         try:
             def check(m: discord.Message):
                 return bool(m.author.bot)
             deleted = await ctx.channel.purge(limit=amount * 2, check=check)
             await ctx.send(f"🧹 Deleted **{len(deleted)}** bot messages", delete_after=5)
         except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to delete messages.", delete_after=5)
+            await ctx.send(_ERR_NO_DELETE_PERMS, delete_after=5)
 
     @commands.command(name="purgetext")
     @mod_check("manage_messages")
     async def p_purge_text(self, ctx, amount: int, *, query: str):
         await self.delete_command_message(ctx)
         if amount < 1 or amount > 100:
-            return await ctx.send("❌ Amount must be between 1 and 100.", delete_after=5)
+            return await ctx.send(_ERR_BAD_AMOUNT, delete_after=5)
         if not query.strip():
             return await ctx.send("❌ Query cannot be empty.", delete_after=5)
         needle = query.lower()
@@ -1170,39 +1497,39 @@ class ModerationCog(commands.Cog):
             deleted = await ctx.channel.purge(limit=amount * 3, check=check)
             await ctx.send(f"🧹 Deleted **{len(deleted)}** messages containing `{query}`", delete_after=5)
         except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to delete messages.", delete_after=5)
+            await ctx.send(_ERR_NO_DELETE_PERMS, delete_after=5)
 
     @commands.command(name="purgebefore")
     @mod_check("manage_messages")
     async def p_purge_before(self, ctx, amount: int, message_id: int):
         await self.delete_command_message(ctx)
         if amount < 1 or amount > 100:
-            return await ctx.send("❌ Amount must be between 1 and 100.", delete_after=5)
+            return await ctx.send(_ERR_BAD_AMOUNT, delete_after=5)
         try:
             anchor = await ctx.channel.fetch_message(int(message_id))
-        except Exception:
+        except (ValueError, discord.NotFound, discord.Forbidden, discord.HTTPException):
             return await ctx.send("❌ Couldn't find that message ID in this channel.", delete_after=5)
         try:
             deleted = await ctx.channel.purge(limit=amount, before=anchor)
             await ctx.send(f"🧹 Deleted **{len(deleted)}** messages before that message", delete_after=5)
         except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to delete messages.", delete_after=5)
+            await ctx.send(_ERR_NO_DELETE_PERMS, delete_after=5)
 
     @commands.command(name="purgeafter")
     @mod_check("manage_messages")
     async def p_purge_after(self, ctx, amount: int, message_id: int):
         await self.delete_command_message(ctx)
         if amount < 1 or amount > 100:
-            return await ctx.send("❌ Amount must be between 1 and 100.", delete_after=5)
+            return await ctx.send(_ERR_BAD_AMOUNT, delete_after=5)
         try:
             anchor = await ctx.channel.fetch_message(int(message_id))
-        except Exception:
+        except (ValueError, discord.NotFound, discord.Forbidden, discord.HTTPException):
             return await ctx.send("❌ Couldn't find that message ID in this channel.", delete_after=5)
         try:
             deleted = await ctx.channel.purge(limit=amount, after=anchor)
             await ctx.send(f"🧹 Deleted **{len(deleted)}** messages after that message", delete_after=5)
         except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to delete messages.", delete_after=5)
+            await ctx.send(_ERR_NO_DELETE_PERMS, delete_after=5)
 
 
 async def setup(bot):
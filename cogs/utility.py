@@ -19,6 +19,9 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Shared green embed color
+EMBED_COLOR = discord.Color.green()
+
 
 class EmbedModal(discord.ui.Modal, title='Create Custom Embed'):
     """Modal for creating custom embeds with proper formatting."""
@@ -235,7 +238,7 @@ class UtilityCog(commands.Cog):
                            "• Colors: hex (#ff0000) or names (red, blue, green, etc.)\n"
                            "• Author icon must be a valid image URL\n"
                            "• Use `!embed` for the form interface",
-                color=discord.Color.green()
+                color=EMBED_COLOR
             )
             await ctx.send(embed=embed, delete_after=30)
             return
@@ -348,8 +351,7 @@ class UtilityCog(commands.Cog):
                             if ctx.interaction:
                                 await ctx.send(error_msg, ephemeral=True)
                             else:
-                                response = await ctx.send(error_msg)
-                                await response.delete(delay=5)
+                                await ctx.send(error_msg, delete_after=5)
                             return
 
                 except (discord.NotFound, discord.HTTPException, ValueError):
@@ -359,8 +361,7 @@ class UtilityCog(commands.Cog):
                     if ctx.interaction:
                         await ctx.send(error_msg, ephemeral=True)
                     else:
-                        response = await ctx.send(error_msg)
-                        await response.delete(delay=5)
+                        await ctx.send(error_msg, delete_after=5)
                     return
 
         if not target:
@@ -368,8 +369,7 @@ class UtilityCog(commands.Cog):
             if ctx.interaction:
                 await ctx.send(error_msg, ephemeral=True)
             else:
-                response = await ctx.send(error_msg)
-                await response.delete(delay=5)
+                await ctx.send(error_msg, delete_after=5)
             return
 
         # Create embed with user information
@@ -1290,7 +1290,7 @@ class UtilityCog(commands.Cog):
         
         embed = discord.Embed(
             description=f"👋 {ctx.author.mention} pats {user.mention} on the head!",
-            color=discord.Color.green()
+            color=EMBED_COLOR
         )
         await ctx.send(embed=embed)
 
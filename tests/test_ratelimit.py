@@ -0,0 +1,242 @@
+"""
+Unit tests for utils.ratelimit, run against a fake clock.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+from utils import ratelimit
+from utils.ratelimit import AdaptiveLimiter, RouteGate, SlidingWindow, retry
+
+
+class FakeClock:
+    """Stands in for time.monotonic and asyncio.sleep; sleeping just advances now."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(ratelimit, "time", SimpleNamespace(monotonic=fake.monotonic))
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", fake.sleep)
+    monkeypatch.setattr(ratelimit.random, "uniform", lambda a, b: 0.0)
+    return fake
+
+
+def http_error(status: int, headers: dict = None, retry_after: float = None) -> discord.HTTPException:
+    response = SimpleNamespace(status=status, reason="stub", headers=headers or {})
+    error = discord.HTTPException(response, "stub")
+    if retry_after is not None:
+        error.retry_after = retry_after
+    return error
+
+
+# ---------- SlidingWindow ----------
+
+def test_window_allows_until_limit(clock):
+    window = SlidingWindow()
+    for _ in range(3):
+        assert window.retry_after("k", 3, 60.0) == 0.0
+        window.record("k", 60.0)
+    assert window.retry_after("k", 3, 60.0) == pytest.approx(60.0)
+
+
+def test_window_reports_time_until_oldest_hit_expires(clock):
+    window = SlidingWindow()
+    window.record("k", 60.0)
+    clock.now += 20.0
+    window.record("k", 60.0)
+    clock.now += 10.0
+    assert window.retry_after("k", 2, 60.0) == pytest.approx(30.0)
+
+
+def test_window_trims_hit_exactly_one_window_old(clock):
+    window = SlidingWindow()
+    window.record("k", 60.0)
+    clock.now += 59.999
+    assert window.retry_after("k", 1, 60.0) == pytest.approx(0.001)
+    clock.now += 0.001
+    assert window.retry_after("k", 1, 60.0) == 0.0
+
+
+def test_window_keys_are_independent(clock):
+    window = SlidingWindow()
+    window.record("a", 60.0)
+    assert window.retry_after("a", 1, 60.0) > 0.0
+    assert window.retry_after("b", 1, 60.0) == 0.0
+
+
+def test_window_sweeps_idle_keys(clock):
+    window = SlidingWindow()
+    for key in range(SlidingWindow._SWEEP_AT):
+        window.record(key, 60.0)
+    clock.now += 30.0
+    window.record("fresh", 60.0)
+    clock.now += 31.0
+    # The next record() sees the cap reached and drops every expired key
+    window.record("trigger", 60.0)
+    assert set(window._hits) == {"fresh", "trigger"}
+
+
+# ---------- AdaptiveLimiter ----------
+
+async def _fail_with(limiter: AdaptiveLimiter, error: Exception) -> None:
+    with pytest.raises(type(error)):
+        async with limiter:
+            raise error
+
+
+def test_limiter_halves_on_429_down_to_minimum():
+    async def main():
+        limiter = AdaptiveLimiter(minimum=1, maximum=32, initial=8)
+        await _fail_with(limiter, http_error(429))
+        assert limiter.limit == 4
+        for _ in range(5):
+            await _fail_with(limiter, http_error(429))
+        assert limiter.limit == 1
+
+    asyncio.run(main())
+
+
+def test_limiter_grows_about_one_per_window_up_to_maximum():
+    async def main():
+        limiter = AdaptiveLimiter(minimum=1, maximum=5, initial=4)
+        for _ in range(4):
+            async with limiter:
+                pass
+        assert limiter.limit == 4  # 4 + 4 * (1/4-ish) lands just under 5
+        for _ in range(100):
+            async with limiter:
+                pass
+        assert limiter.limit == 5
+
+    asyncio.run(main())
+
+
+def test_limiter_ignores_other_errors():
+    async def main():
+        limiter = AdaptiveLimiter(initial=4)
+        await _fail_with(limiter, http_error(503))
+        await _fail_with(limiter, ValueError("boom"))
+        assert limiter.limit == 4
+
+    asyncio.run(main())
+
+
+def test_limiter_caps_concurrency():
+    async def main():
+        limiter = AdaptiveLimiter(initial=2)
+        peak = in_flight = 0
+        release = asyncio.Event()
+
+        async def call():
+            nonlocal peak, in_flight
+            async with limiter:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await release.wait()
+                in_flight -= 1
+
+        tasks = [asyncio.create_task(call()) for _ in range(5)]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert peak == 2
+        release.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+
+
+# ---------- RouteGate ----------
+
+def test_gate_holds_route_until_reset_after(clock):
+    async def main():
+        gate = RouteGate()
+        with pytest.raises(discord.HTTPException):
+            async with gate("guild_ban"):
+                raise http_error(429, headers={"X-RateLimit-Reset-After": "2.5"})
+        async with gate("member_edit"):
+            pass
+        assert clock.sleeps == []
+        async with gate("guild_ban"):
+            pass
+        assert clock.sleeps == [pytest.approx(2.5)]
+
+    asyncio.run(main())
+
+
+def test_gate_defaults_reset_after_to_one_second(clock):
+    async def main():
+        gate = RouteGate()
+        with pytest.raises(discord.HTTPException):
+            async with gate("guild_ban"):
+                raise http_error(429, headers={"X-RateLimit-Reset-After": "soon"})
+        async with gate("guild_ban"):
+            pass
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    asyncio.run(main())
+
+
+# ---------- retry ----------
+
+def _failing(*errors, result="ok"):
+    """Coroutine factory raising each error in turn, then returning result."""
+    pending = list(errors)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if pending:
+            raise pending.pop(0)
+        return result
+
+    return call, calls
+
+
+def test_retry_prefers_retry_after_attribute(clock):
+    call, calls = _failing(http_error(429, headers={"Retry-After": "9"}, retry_after=1.5))
+    assert asyncio.run(retry(call)) == "ok"
+    assert len(calls) == 2
+    assert clock.sleeps == [1.5]
+
+
+def test_retry_falls_back_to_retry_after_header(clock):
+    call, _ = _failing(http_error(429, headers={"Retry-After": "3"}))
+    assert asyncio.run(retry(call)) == "ok"
+    assert clock.sleeps == [3.0]
+
+
+def test_retry_backs_off_exponentially_on_server_errors(clock):
+    call, calls = _failing(http_error(503), http_error(502), http_error(500))
+    assert asyncio.run(retry(call, base=0.25, cap=0.75)) == "ok"
+    assert len(calls) == 4
+    assert clock.sleeps == [0.25, 0.5, 0.75]
+
+
+def test_retry_reraises_after_last_attempt(clock):
+    call, calls = _failing(*(http_error(503) for _ in range(5)))
+    with pytest.raises(discord.HTTPException):
+        asyncio.run(retry(call, max_attempts=3))
+    assert len(calls) == 3
+    assert len(clock.sleeps) == 2
+
+
+def test_retry_does_not_retry_client_errors(clock):
+    call, calls = _failing(http_error(400))
+    with pytest.raises(discord.HTTPException):
+        asyncio.run(retry(call))
+    assert len(calls) == 1
+    assert clock.sleeps == []
@@ -7,6 +7,11 @@ import discord
 from typing import Union, Optional
 from discord.ext import commands
 
+# Any one of these lets a member moderate (administrator implies all of them)
+_MOD_PERMS_MASK = discord.Permissions(
+    kick_members=True, ban_members=True, moderate_members=True, administrator=True
+).value
+
 def has_moderation_permissions(moderator: discord.Member, target: discord.Member) -> bool:
     """
     Check if a moderator has permission to moderate a target member.
@@ -23,20 +28,16 @@ def has_moderation_permissions(moderator: discord.Member, target: discord.Member
         return False
     
     # Can't moderate the server owner
-    if target == target.guild.owner:
+    if target.id == target.guild.owner_id:
         return False
     
     # Server owner can moderate anyone
-    if moderator == moderator.guild.owner:
+    if moderator.id == moderator.guild.owner_id:
         return True
     
     # Check if moderator has required permissions
-    if not any([
-        moderator.guild_permissions.kick_members,
-        moderator.guild_permissions.ban_members,
-        moderator.guild_permissions.moderate_members,
-        moderator.guild_permissions.administrator
-    ]):
+    # (guild_permissions recomputes from every role on access, so read it once)
+    if not moderator.guild_permissions.value & _MOD_PERMS_MASK:
         return False
     
     # Check role hierarchy
@@ -54,7 +55,7 @@ def has_higher_role(bot_member: discord.Member, target: discord.Member) -> bool:
         bool: True if bot can moderate target, False otherwise
     """
     # Can't moderate the server owner
-    if target == target.guild.owner:
+    if target.id == target.guild.owner_id:
         return False
     
     # Check role hierarchy
@@ -71,18 +72,20 @@ def can_execute_command(user: discord.Member, command_name: str) -> bool:
     Returns:
         bool: True if user can execute command, False otherwise
     """
-    permission_map = {
-        'kick': user.guild_permissions.kick_members,
-        'ban': user.guild_permissions.ban_members,
-        'unban': user.guild_permissions.ban_members,
-        'timeout': user.guild_permissions.moderate_members,
-        'untimeout': user.guild_permissions.moderate_members,
-    }
+    perms = user.guild_permissions
     
     # Administrator can do everything
-    if user.guild_permissions.administrator:
+    if perms.administrator:
         return True
     
+    permission_map = {
+        'kick': perms.kick_members,
+        'ban': perms.ban_members,
+        'unban': perms.ban_members,
+        'timeout': perms.moderate_members,
+        'untimeout': perms.moderate_members,
+    }
+    
     # Check specific permission for command
     return permission_map.get(command_name, True)
 
@@ -198,14 +201,15 @@ def has_mod_permissions(member: discord.Member, bot,
     Returns:
         bool: True if member has required permissions
     """
+    perms = member.guild_permissions
+    
     # Always allow administrators
-    if member.guild_permissions.administrator:
+    if perms.administrator:
         return True
     
     # Check specific Discord permission if provided
     if required_discord_perm:
-        discord_perm = getattr(member.guild_permissions,
-                               required_discord_perm, False)
+        discord_perm = getattr(perms, required_discord_perm, False)
         if discord_perm:
             return True
     
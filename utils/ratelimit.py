@@ -0,0 +1,157 @@
+"""
+Rate limiting utilities for outbound Discord REST calls.
+"""
+import asyncio
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+import discord
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit that adapts like TCP congestion control (AIMD).
+
+    Each success grows the window by 1/window (about +1 per full window);
+    a 429 halves it. The window stays between minimum and maximum.
+    """
+
+    def __init__(self, minimum: int = 1, maximum: int = 32, initial: int = 4):
+        self._min = minimum
+        self._max = maximum
+        self._window = float(initial)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._window)
+
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._cond:
+            self._in_flight -= 1
+            if isinstance(exc, discord.HTTPException) and exc.status == 429:
+                self._window = max(self._min, self._window / 2)
+            elif exc_type is None:
+                self._window = min(self._max, self._window + 1 / self._window)
+            self._cond.notify_all()
+        return False
+
+
+class RouteGate:
+    """
+    Coordinates outbound REST calls per logical route (e.g. "guild_ban").
+
+    Limits calls in flight with an AdaptiveLimiter and, after a 429 surfaces,
+    holds every caller of that route until Discord's reset window has passed.
+    """
+
+    def __init__(self, max_concurrency: int = 32):
+        self._limiter = AdaptiveLimiter(maximum=max_concurrency)
+        # route -> time.monotonic() before which no call may start
+        self._next_allowed: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def __call__(self, route: str):
+        async with self._limiter:
+            delay = self._next_allowed.get(route, 0.0) - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                yield
+            except discord.HTTPException as e:
+                if e.status == 429:
+                    self._next_allowed[route] = time.monotonic() + _reset_after(e)
+                raise
+
+
+def _reset_after(error: discord.HTTPException) -> float:
+    """Seconds until the route's bucket resets, read from the 429 response."""
+    headers = getattr(error.response, "headers", None) or {}
+    try:
+        return float(headers.get("X-RateLimit-Reset-After", 1.0))
+    except ValueError:
+        return 1.0
+
+
+def _retry_after_header(error: discord.HTTPException) -> float:
+    """Retry-After from the response headers, or 0.0 if absent."""
+    headers = getattr(error.response, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After", 0))
+    except ValueError:
+        return 0.0
+
+
+# Statuses worth retrying: rate limited or a transient server-side failure
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+async def retry(coro_factory, *, max_attempts: int = 4, base: float = 0.25, cap: float = 4.0):
+    """
+    Await coro_factory() and retry transient Discord failures with backoff.
+
+    Args:
+        coro_factory: Zero-argument callable returning a fresh coroutine per attempt
+        max_attempts: Total attempts before the last error is re-raised
+        base: First backoff delay in seconds, doubled per attempt
+        cap: Upper bound for a single backoff delay
+
+    Returns:
+        Whatever the coroutine returns
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await coro_factory()
+        except discord.HTTPException as e:
+            if e.status not in _RETRY_STATUSES or attempt == max_attempts - 1:
+                raise
+            retry_after = getattr(e, "retry_after", None) or _retry_after_header(e)
+            if e.status == 429 and retry_after:
+                delay = retry_after
+            else:
+                delay = min(cap, base * 2 ** attempt) + random.uniform(0, 0.25)
+            await asyncio.sleep(delay)
+
+
+class SlidingWindow:
+    """
+    Sliding-window call counter keyed by anything hashable.
+
+    Keys are typically (guild_id, user_id) or guild_id; each keeps the
+    monotonic timestamps of its calls inside the current window.
+    """
+
+    # Above this many tracked keys, idle ones are swept on the next record()
+    _SWEEP_AT = 4096
+
+    def __init__(self):
+        self._hits: dict = {}
+
+    def retry_after(self, key, limit: int, window: float) -> float:
+        """Seconds until key may call again; 0.0 if it is under its limit now."""
+        hits = self._hits.get(key)
+        if not hits:
+            return 0.0
+        cutoff = time.monotonic() - window
+        while hits and hits[0] <= cutoff:
+            hits.popleft()
+        if len(hits) < limit:
+            return 0.0
+        return hits[0] - cutoff
+
+    def record(self, key, window: float) -> None:
+        """Count one call for key."""
+        now = time.monotonic()
+        if len(self._hits) >= self._SWEEP_AT:
+            cutoff = now - window
+            self._hits = {k: v for k, v in self._hits.items() if v and v[-1] > cutoff}
+        self._hits.setdefault(key, deque()).append(now)